@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable, List, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
 
 import ezdxf
+import numpy as np
 from ezdxf import colors as ezdxf_colors
 
-from .mapping import MappingManager
-from .models import ConversionOptions, ConversionResult, LayerAttributes, SvgDocument, SvgPrimitive, parse_rgb
-from .svg_loader import parse_length
+from .mapping import TRUTHY_STRINGS, MappingManager, sanitize_style_name
+from .models import (
+    ConversionOptions,
+    ConversionResult,
+    LayerAttributes,
+    PointArray,
+    SvgDocument,
+    SvgPrimitive,
+    parse_length,
+    parse_rgb,
+)
 
 # AutoCAD Color Index (ACI) to RGB mapping for standard colors
 ACI_TO_RGB = {
@@ -24,25 +35,27 @@ ACI_TO_RGB = {
     # ... other colors can be added if needed
 }
 
+_ACI_KEYS = np.array(list(ACI_TO_RGB), dtype=np.int32)
+_ACI_PALETTE = np.array(list(ACI_TO_RGB.values()), dtype=np.int32)
 
-def rgb_to_aci(rgb: Tuple[int, int, int]) -> int:
-    """Finds the closest ACI color for a given RGB tuple."""
-    min_dist = float("inf")
-    closest_aci = 7  # Default to white/black
+CENTER_ANCHORS = frozenset({"middle", "center"})
+RIGHT_ANCHORS = frozenset({"end", "right"})
+INHERITED_COLORS = frozenset({"BYLAYER", "BYBLOCK"})
+
+DXF_WRITE_BUFFER_SIZE = 8 * 1024 * 1024
 
-    # First, check for an exact match in the standard palette
-    for aci, aci_rgb in ACI_TO_RGB.items():
-        if aci_rgb == rgb:
-            return aci
+_MISSING = object()
 
-    # If no exact match, find the closest color by Euclidean distance
+
+@lru_cache(maxsize=1024)
+def rgb_to_aci(rgb: Tuple[int, int, int]) -> int:
+    """Finds the closest ACI color for a given RGB tuple."""
+    # Squared Euclidean distance against the whole palette at once; an exact
+    # match has distance 0 and ties resolve to the first ACI in the table.
     # This is a simplified approach. ezdxf has a more sophisticated one.
-    for aci, aci_rgb in ACI_TO_RGB.items():
-        dist = sum([(c1 - c2) ** 2 for c1, c2 in zip(rgb, aci_rgb)])
-        if dist < min_dist:
-            min_dist = dist
-            closest_aci = aci
-    return closest_aci
+    diff = _ACI_PALETTE - np.asarray(rgb, dtype=np.int32)
+    index = int(np.argmin((diff * diff).sum(axis=1)))
+    return int(_ACI_KEYS[index])
 
 
 class DxfWriter:
@@ -50,7 +63,16 @@ class DxfWriter:
 
     def __init__(self) -> None:
         self._style_cache: set[str] = set()
+        self._font_style_cache: Dict[str | None, str | None] = {}
         self.mapping: MappingManager | None = None
+        self._log_enabled = True
+        self._writers = {
+            "line": self._write_line,
+            "polyline": self._write_polyline,
+            "circle": self._write_circle,
+            "ellipse": self._write_ellipse,
+            "text": self._write_text,
+        }
 
     def write(self, document: SvgDocument, options: ConversionOptions, mapping: MappingManager) -> ConversionResult:
         doc = ezdxf.new("R2013")
@@ -59,33 +81,34 @@ class DxfWriter:
         log_messages: List[str] = []
         warnings: List[str] = []
         layers_created = set()
+        # Primitives share a handful of layer setups; build their DXF attribs once.
+        attribs_cache: Dict[Tuple[str, str, str, float | None], Dict[str, Any]] = {}
 
         self.mapping = mapping
+        self._log_enabled = options.verbose
+        self._style_cache.clear()
+        self._font_style_cache.clear()
 
         for primitive in document.primitives:
             attrs = mapping.resolve(primitive)
-            dxf_attribs = attrs.to_dxf_attribs()
-            ensure_layer(doc, attrs.layer, attrs)
-            if attrs.layer not in layers_created:
+            attribs_key = (attrs.layer, attrs.color, attrs.linetype, attrs.lineweight_mm)
+            dxf_attribs = attribs_cache.get(attribs_key)
+            if dxf_attribs is None:
+                dxf_attribs = attrs.to_dxf_attribs()
+                ensure_layer(doc, attrs.layer, attrs)
                 layers_created.add(attrs.layer)
+                attribs_cache[attribs_key] = dxf_attribs
 
+            writer = self._writers.get(primitive.kind)
+            if writer is None:
+                warnings.append(f"미지원 요소 건너뜀: {primitive.label()}")
+                continue
             try:
-                if primitive.kind == "line":
-                    written += self._write_line(msp, primitive.points, dxf_attribs, log_messages, primitive)
-                elif primitive.kind == "polyline":
-                    written += self._write_polyline(msp, primitive.points, primitive.extra, dxf_attribs, log_messages, primitive)
-                elif primitive.kind == "circle":
-                    written += self._write_circle(msp, primitive, dxf_attribs, log_messages)
-                elif primitive.kind == "ellipse":
-                    written += self._write_ellipse(msp, primitive, dxf_attribs, log_messages)
-                elif primitive.kind == "text":
-                    written += self._write_text(doc, msp, primitive, dxf_attribs, log_messages)
-                else:
-                    warnings.append(f"미지원 요소 건너뜀: {primitive.label()}")
+                written += writer(msp, primitive, dxf_attribs, log_messages)
             except Exception as exc:  # pragma: no cover - defensive
                 warnings.append(f"DXF 작성 실패 ({primitive.label()}): {exc}")
 
-        doc.saveas(str(options.output_path))
+        save_dxf(doc, options.output_path)
         self.mapping = None
 
         result = ConversionResult(
@@ -97,92 +120,86 @@ class DxfWriter:
         )
         return result
 
-    def _write_line(self, msp, points: List[Tuple[float, float]], attrs, log, primitive) -> int:
+    def _write_line(self, msp, primitive: SvgPrimitive, attrs, log) -> int:
+        points = primitive.points
         if len(points) != 2:
             return 0
         msp.add_line(points[0], points[1], dxfattribs=attrs)
-        log.append(f"LINE: {primitive.label()} -> {attrs.get('layer')}")
+        if self._log_enabled:
+            log.append(f"LINE: {primitive.label()} -> {attrs.get('layer')}")
         return 1
 
-    def _write_polyline(self, msp, points: List[Tuple[float, float]], extra, attrs, log, primitive) -> int:
+    def _write_polyline(self, msp, primitive: SvgPrimitive, attrs, log) -> int:
+        points = primitive.points
         if len(points) < 2:
             return 0
-        closed = bool(extra.get("closed")) if isinstance(extra, dict) else False
-        fill_raw_value = (primitive.style.get("fill") or "").strip()
-        fill_value = fill_raw_value.lower()
-        has_fill = closed and fill_value not in {"", "none", "transparent"}
-        entities_created = 0
+        plan = primitive.polyline_plan
+        if not plan.has_fill:
+            # Most primitives are plain outlines: no hatch, pattern or fill color work.
+            if plan.skip:
+                return 0
+            return self._write_polyline_outline(msp, primitive, attrs, log)
+
+        style = primitive.resolved_style
+        fill_raw_value = style.fill
+        fill_value = style.fill_norm
 
         mapping = self.mapping
         pattern_info = None
         pattern_color_spec = None
         pattern_id = None
-        if has_fill and mapping:
+        if mapping:
             pattern_id = mapping.extract_pattern_id(fill_value)
             pattern_info = mapping.resolve_pattern(pattern_id)
             if pattern_info:
                 pattern_color_spec = mapping.normalize_color(pattern_info.get("color"))
 
-        stroke_value_raw = primitive.style.get("stroke") or ""
-        stroke_value = stroke_value_raw.strip().lower()
-        stroke_width_raw = primitive.style.get("stroke-width")
-        stroke_width = None
-        if stroke_width_raw:
-            try:
-                stroke_width = float(stroke_width_raw)
-            except ValueError:
-                stroke_width = parse_length(stroke_width_raw)
-        material_class = any(cls.startswith("material-") for cls in primitive.classes)
-
-        if not closed and material_class and "projection" in primitive.classes:
-            if stroke_value in {"", "none", "transparent"}:
-                return 0
-            if stroke_width is not None and stroke_width <= 0.1:
-                return 0
-
-        if has_fill:
-            hatch_layer = attrs.get("layer")
-            hatch = msp.add_hatch(dxfattribs={"layer": hatch_layer} if hatch_layer else {})
-            if pattern_info:
-                if str(pattern_info.get("solid", False)).lower() in {"true", "1", "yes", "y"}:
-                    hatch.set_solid_fill(True)
-                else:
-                    pattern_name = pattern_info.get("pattern")
-                    if pattern_name:
-                        scale = float(pattern_info.get("scale", 1.0) or 1.0)
-                        angle = float(pattern_info.get("angle", 0.0) or 0.0)
-                        try:
-                            hatch.set_pattern_fill(pattern_name, scale=scale, angle=angle)
-                        except ezdxf.DXFValueError:
-                            hatch.set_solid_fill(True)
-                    else:
-                        hatch.set_solid_fill(True)
-            else:
+        layer_name = attrs.get("layer")
+        label = primitive.label() if self._log_enabled else None
+        hatch = msp.add_hatch(dxfattribs={"layer": layer_name} if layer_name else {})
+        if pattern_info:
+            if str(pattern_info.get("solid", False)).lower() in TRUTHY_STRINGS:
                 hatch.set_solid_fill(True)
+            else:
+                pattern_name = pattern_info.get("pattern")
+                if pattern_name:
+                    scale = float(pattern_info.get("scale", 1.0) or 1.0)
+                    angle = float(pattern_info.get("angle", 0.0) or 0.0)
+                    try:
+                        hatch.set_pattern_fill(pattern_name, scale=scale, angle=angle)
+                    except ezdxf.DXFValueError:
+                        hatch.set_solid_fill(True)
+                else:
+                    hatch.set_solid_fill(True)
+        else:
+            hatch.set_solid_fill(True)
+
+        color_spec = pattern_color_spec or (mapping.normalize_color(fill_raw_value) if mapping else None)
+        self._apply_entity_color(hatch, color_spec, attrs)
+        hatch.paths.add_polyline_path(points, is_closed=True)
+        if self._log_enabled:
+            log.append(f"HATCH: {label} -> {layer_name}")
+        entities_created = 1
 
-            color_spec = pattern_color_spec or (mapping.normalize_color(fill_raw_value) if mapping else None)
-            self._apply_entity_color(hatch, color_spec, attrs)
-            hatch.paths.add_polyline_path(points, is_closed=True)
-            log.append(f"HATCH: {primitive.label()} -> {attrs.get('layer')}")
-            entities_created += 1
-
-        skip_boundary = False
-        if has_fill and material_class and "cut" not in primitive.classes:
-            if stroke_value in {"", "none", "transparent"}:
-                skip_boundary = True
-            elif stroke_width is not None and stroke_width <= 0.1:
-                skip_boundary = True
-
-        if not skip_boundary:
-            poly_points = points
-            if closed and points[0] == points[-1] and len(points) > 1:
-                poly_points = points[:-1]
-            msp.add_lwpolyline(poly_points, format="xy", close=closed, dxfattribs=attrs)
-            log.append(f"LWPOLYLINE({len(poly_points)}): {primitive.label()} -> {attrs.get('layer')} closed={closed}")
-            entities_created += 1
+        if not plan.skip_boundary:
+            entities_created += self._write_polyline_outline(msp, primitive, attrs, log, label)
 
         return entities_created
 
+    def _write_polyline_outline(self, msp, primitive: SvgPrimitive, attrs, log, label: str | None = None) -> int:
+        points = primitive.points
+        closed = primitive.polyline_plan.closed
+        # Closed rings repeat their first vertex; drop it by count instead of slicing a copy.
+        count = len(points)
+        if closed and count > 1:
+            first, last = points[0], points[-1]
+            if first[0] == last[0] and first[1] == last[1]:
+                count -= 1
+        add_lwpolyline_fast(msp, points, closed, attrs, count)
+        if self._log_enabled:
+            log.append(f"LWPOLYLINE({count}): {label or primitive.label()} -> {attrs.get('layer')} closed={closed}")
+        return 1
+
     def _write_circle(self, msp, primitive: SvgPrimitive, attrs, log) -> int:
         center = primitive.points[0]
         radius_x = primitive.extra.get("radius_x", 0.0)
@@ -190,11 +207,13 @@ class DxfWriter:
         if math.isclose(radius_x, radius_y, rel_tol=1e-3):
             radius = radius_x
             msp.add_circle(center, radius, dxfattribs=attrs)
-            log.append(f"CIRCLE r={radius:.3f}")
+            if self._log_enabled:
+                log.append(f"CIRCLE r={radius:.3f}")
         else:
             ratio = radius_y / radius_x if radius_x else 1.0
             msp.add_ellipse(center, major_axis=(radius_x, 0), ratio=ratio, dxfattribs=attrs)
-            log.append(f"ELLIPSE rx={radius_x:.3f} ry={radius_y:.3f}")
+            if self._log_enabled:
+                log.append(f"ELLIPSE rx={radius_x:.3f} ry={radius_y:.3f}")
         return 1
 
     def _write_ellipse(self, msp, primitive: SvgPrimitive, attrs, log) -> int:
@@ -203,25 +222,27 @@ class DxfWriter:
         radius_y = primitive.extra.get("radius_y", 0.0)
         ratio = radius_y / radius_x if radius_x else 1.0
         msp.add_ellipse(center, major_axis=(radius_x, 0), ratio=ratio, dxfattribs=attrs)
-        log.append(f"ELLIPSE rx={radius_x:.3f} ry={radius_y:.3f}")
+        if self._log_enabled:
+            log.append(f"ELLIPSE rx={radius_x:.3f} ry={radius_y:.3f}")
         return 1
 
-    def _write_text(self, doc, msp, primitive: SvgPrimitive, attrs, log) -> int:
+    def _write_text(self, msp, primitive: SvgPrimitive, attrs, log) -> int:
         position = primitive.points[0]
         content = primitive.extra.get("text", "")
         if not content:
             return 0
         scale_factor = float(primitive.extra.get("text_scale", 1.0) or 1.0)
         height = self._font_size_to_height(primitive.style) * abs(scale_factor)
-        text_attrs = dict(attrs)
-        text_attrs.setdefault("height", height)
         rotation = float(primitive.extra.get("rotation_deg", 0.0) or 0.0)
-        anchor = (primitive.extra or {}).get("text_anchor")
         font_family = primitive.extra.get("font_family")
 
-        style_name = self._ensure_text_style(doc, font_family)
+        # attrs is shared between primitives; ezdxf copies dxfattribs anyway, so build
+        # the per-text dict in one go rather than copying and then patching it.
+        style_name = self._ensure_text_style(msp.doc, font_family)
         if style_name:
-            text_attrs["style"] = style_name
+            text_attrs = {"height": height, **attrs, "style": style_name}
+        else:
+            text_attrs = {"height": height, **attrs}
 
         if "\n" in content:
             mtext_content = content.replace("\n", "\\P")
@@ -237,13 +258,14 @@ class DxfWriter:
         anchor = (primitive.extra or {}).get("text_anchor")
         if isinstance(anchor, str):
             anchor = anchor.lower()
-        if anchor in {"middle", "center"} and hasattr(entity.dxf, "halign"):
+        if anchor in CENTER_ANCHORS and hasattr(entity.dxf, "halign"):
             entity.dxf.halign = 1  # center
             entity.dxf.align_point = position
-        elif anchor in {"end", "right"} and hasattr(entity.dxf, "halign"):
+        elif anchor in RIGHT_ANCHORS and hasattr(entity.dxf, "halign"):
             entity.dxf.halign = 2  # right
             entity.dxf.align_point = position
-        log.append(f"TEXT '{content[:20]}' h={height:.2f} rot={rotation:.1f}")
+        if self._log_enabled:
+            log.append(f"TEXT '{content[:20]}' h={height:.2f} rot={rotation:.1f}")
         return 1
 
     @staticmethod
@@ -257,6 +279,14 @@ class DxfWriter:
         return length
 
     def _ensure_text_style(self, doc, font_family: str | None) -> str | None:
+        cached = self._font_style_cache.get(font_family, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        style_name = self._create_text_style(doc, font_family)
+        self._font_style_cache[font_family] = style_name
+        return style_name
+
+    def _create_text_style(self, doc, font_family: str | None) -> str | None:
         mapping = self.mapping
         font_entry = mapping.resolve_font(font_family) if mapping else None
         style_name = None
@@ -300,7 +330,7 @@ class DxfWriter:
                 entity.dxf.color = fallback_attrs["color"]
             return
 
-        if color_spec.upper() in {"BYLAYER", "BYBLOCK"}:
+        if color_spec.upper() in INHERITED_COLORS:
             # Let the entity inherit color from layer/block
             return
 
@@ -323,6 +353,37 @@ class DxfWriter:
                 pass  # Invalid hex, do nothing
 
 
+def add_lwpolyline_fast(msp, points: PointArray, closed: bool, dxfattribs: dict, count: int | None = None):
+    """Create an LWPOLYLINE from 2D points with a single vertex-array write.
+
+    ``msp.add_lwpolyline`` appends the points one by one, and every append
+    reallocates the packed vertex array, which is quadratic for long
+    polylines. Here the (x, y, start_width, end_width, bulge) rows are
+    prepared up front instead. ``count`` limits the vertices to the first
+    ``count`` points.
+    """
+    entity = msp.new_entity("LWPOLYLINE", dxfattribs)
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if count is not None:
+        coords = coords[:count]
+    vertices = np.zeros((len(coords), 5), dtype=np.float64)
+    vertices[:, :2] = coords
+    entity.lwpoints.extend(vertices)
+    entity.closed = closed
+    return entity
+
+
+def save_dxf(doc, path: Path) -> None:
+    """Write ``doc`` like ``doc.saveas`` but through one large write buffer.
+
+    Big drawings produce hundreds of MB of short DXF tag lines; a larger
+    buffer turns them into far fewer write syscalls.
+    """
+    with open(path, "wt", encoding=doc.output_encoding, errors="dxfreplace", buffering=DXF_WRITE_BUFFER_SIZE) as stream:
+        doc.write(stream)
+    doc.filename = str(path)
+
+
 def ensure_layer(doc: ezdxf.EzDxf, layer_name: str, attrs: LayerAttributes) -> None:
     if layer_name in doc.layers:
         return
@@ -338,14 +399,3 @@ def ensure_layer(doc: ezdxf.EzDxf, layer_name: str, attrs: LayerAttributes) -> N
             color = 7
 
     doc.layers.add(name=layer_name, color=color, linetype=attrs.linetype or "Continuous")
-
-
-def sanitize_style_name(name: str) -> str:
-    sanitized = []
-    for ch in name.strip():
-        if ch.isalnum() or ch in "-_":
-            sanitized.append(ch)
-        elif ch == " ":
-            sanitized.append("_")
-    value = "".join(sanitized)
-    return value[:31] if value else "STANDARD"
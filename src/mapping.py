@@ -2,12 +2,32 @@ from __future__ import annotations
 
 import fnmatch
 import json
+import os
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Pattern, Sequence, Tuple
 
-from .models import LayerAttributes, MappingRule, SvgPrimitive, parse_rgb
-from .svg_loader import parse_length
+try:  # orjson is optional; it only speeds up reading the style config.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
+from .models import LayerAttributes, MappingRule, SvgPrimitive, parse_length, parse_rgb
+
+# (selector type, attr/style name, raw glob, compiled glob)
+CompiledSelector = Tuple[str, "str | None", "str | None", "Pattern[str] | None"]
+CompiledRule = Tuple[MappingRule, str, "str | None", "str | None", "Pattern[str] | None"]
+
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# ``\w`` follows str.isalnum() (plus "_"), so non-ASCII names such as Korean fonts are kept.
+_LAYER_NAME_INVALID_RE = re.compile(r"[^\w-]")
+_STYLE_NAME_INVALID_RE = re.compile(r"[^\w\- ]")
+# int(..., 16) alone would also take signs, underscores and whitespace.
+_HEX_COLOR_RE = re.compile(r"[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6}")
 
 STYLE_CONFIG_PATH = Path("ReferenceBonsaiSource/style_mapping.json")
 LEGACY_MATERIAL_PATH = Path("ReferenceBonsaiSource/material_layers.json")
@@ -54,23 +74,79 @@ CSS_COLOR_MAP: Dict[str, str] = {
     "darkgray": "#404040",
 }
 
+TRUTHY_STRINGS = frozenset({"true", "1", "yes", "y"})
+
+DEFAULT_RULES: Tuple[MappingRule, ...] = (
+    MappingRule("class:IfcWall*", "A-WALL", "#000000", "Continuous", 0.35),
+    MappingRule("class:IfcSlab*", "A-SLAB", "#000000", "Continuous", 0.35),
+    MappingRule("class:IfcColumn*", "A-COLU", "#000000", "Continuous", 0.35),
+    MappingRule("class:IfcBeam*", "A-BEAM", "#000000", "Continuous", 0.35),
+    MappingRule("class:IfcDoor*", "A-DOOR", "#000000", "Continuous", 0.25),
+    MappingRule("class:IfcWindow*", "A-WIN", "#000000", "Continuous", 0.25),
+    MappingRule("class:PredefinedType-DIMENSION", "A-DIMS", "#000000", "Continuous", 0.18),
+    MappingRule("class:DIMENSION", "A-DIMS", "#000000", "Continuous", 0.18),
+    MappingRule("class:PredefinedType-TEXT", "A-ANNO", "#000000", "Continuous", 0.18),
+    MappingRule("class:annotation", "A-ANNO", "#000000", "Continuous", 0.18),
+    MappingRule("class:IfcAnnotation*", "A-ANNO", "#000000", "Continuous", 0.18),
+    MappingRule("class:GRID", "A-GRID", "#000000", "Continuous", 0.18),
+    MappingRule("class:PredefinedType-GRID", "A-GRID", "#000000", "Continuous", 0.18),
+    MappingRule("tag:text", "A-TEXT", "#000000", "Continuous", 0.18),
+    MappingRule("any", "0", "BYLAYER", "Continuous", None),
+)
+
+
+def _canon(entry: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Order-independent form of a map entry, with numbers rounded as save_config writes them."""
+    items = []
+    for key, value in entry.items():
+        if value in (None, ""):
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = round(float(value), 6)
+        items.append((key, value))
+    return tuple(sorted(items))
+
+
+_DEFAULT_PATTERN_CANON: Dict[str, Tuple[Tuple[str, Any], ...]] = {
+    key: _canon(value) for key, value in DEFAULT_PATTERN_MAP.items()
+}
+_DEFAULT_FONT_CANON: Dict[str, Tuple[Tuple[str, Any], ...]] = {
+    key: _canon(value) for key, value in DEFAULT_FONT_MAP.items()
+}
+
 
 def _load_style_config() -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Return the raw style config, re-reading only when a config file's mtime changes."""
+    return _read_style_config(_mtime_ns(STYLE_CONFIG_PATH), _mtime_ns(LEGACY_MATERIAL_PATH))
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _read_style_config(
+    style_mtime: int | None, legacy_mtime: int | None
+) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    # The raw dicts are shared between calls, so callers must not mutate them.
     materials: Dict[str, Any] = {}
     patterns: Dict[str, Any] = {}
     fonts: Dict[str, Any] = {}
-    if STYLE_CONFIG_PATH.exists():
+    if style_mtime is not None:
         try:
-            data = json.loads(STYLE_CONFIG_PATH.read_text(encoding="utf-8"))
+            data = _json_loads(STYLE_CONFIG_PATH.read_bytes())
             materials = data.get("materials", {}) if isinstance(data, dict) else {}
             patterns = data.get("patterns", {}) if isinstance(data, dict) else {}
             fonts = data.get("fonts", {}) if isinstance(data, dict) else {}
-        except json.JSONDecodeError:
+        except (OSError, json.JSONDecodeError):
             pass
-    elif LEGACY_MATERIAL_PATH.exists():
+    elif legacy_mtime is not None:
         try:
-            materials = json.loads(LEGACY_MATERIAL_PATH.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            materials = _json_loads(LEGACY_MATERIAL_PATH.read_bytes())
+        except (OSError, json.JSONDecodeError):
             pass
     return materials, patterns, fonts
 
@@ -80,7 +156,7 @@ def _normalize_material_map(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     for key, value in data.items():
         if not isinstance(key, str):
             continue
-        key_clean = key.strip()
+        key_clean = sys.intern(key.strip())
         if not key_clean:
             continue
         entry: Dict[str, Any] = {}
@@ -100,7 +176,7 @@ def _normalize_pattern_map(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     for key, value in data.items():
         if not isinstance(key, str):
             continue
-        key_clean = key.strip()
+        key_clean = sys.intern(key.strip())
         if not key_clean:
             continue
         entry: Dict[str, Any] = {}
@@ -130,18 +206,23 @@ def _coerce_pattern_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     if "solid" in coerced:
         value = coerced["solid"]
         if isinstance(value, str):
-            coerced["solid"] = value.strip().lower() in {"true", "1", "yes", "y"}
+            coerced["solid"] = value.strip().lower() in TRUTHY_STRINGS
         else:
             coerced["solid"] = bool(value)
     return coerced
 
 
+_DEFAULT_PATTERN_COERCED: Dict[str, Dict[str, Any]] = {
+    key: _coerce_pattern_entry(value) for key, value in DEFAULT_PATTERN_MAP.items()
+}
+
+
 def _normalize_font_map(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     result: Dict[str, Dict[str, Any]] = {}
     for key, value in data.items():
         if not isinstance(key, str):
             continue
-        key_clean = key.strip()
+        key_clean = sys.intern(key.strip())
         if not key_clean:
             continue
         entry: Dict[str, Any] = {}
@@ -158,6 +239,75 @@ def _normalize_font_map(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return result
 
 
+@dataclass
+class RuleIndex:
+    """Lookup tables that find the first matching rule without testing every selector.
+
+    Literal ``class:``/``tag:``/``id:`` selectors go into dicts and
+    ``class:prefix*`` selectors into a prefix list; everything else is kept in
+    rule order and only tried while it could still beat the best indexed match.
+    """
+
+    rules: List[MappingRule] = field(default_factory=list)
+    class_exact: Dict[str, int] = field(default_factory=dict)
+    class_prefixes: List[Tuple[str, int]] = field(default_factory=list)
+    tag_exact: Dict[str, int] = field(default_factory=dict)
+    id_exact: Dict[str, int] = field(default_factory=dict)
+    ordered: List[Tuple[int, str, str | None, Pattern[str] | None]] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, compiled: Sequence[CompiledRule]) -> "RuleIndex":
+        index = cls()
+        for position, (rule, selector_type, name, glob, pattern) in enumerate(compiled):
+            index.rules.append(rule)
+            if selector_type == "class" and glob is not None:
+                folded = _fold_case(glob)
+                if not _has_glob_magic(folded):
+                    index.class_exact.setdefault(folded, position)
+                    continue
+                if folded.endswith("*") and not _has_glob_magic(folded[:-1]):
+                    index.class_prefixes.append((folded[:-1], position))
+                    continue
+            elif selector_type in {"tag", "id"} and glob is not None:
+                folded = _fold_case(glob)
+                if not _has_glob_magic(folded):
+                    exact = index.tag_exact if selector_type == "tag" else index.id_exact
+                    exact.setdefault(folded, position)
+                    continue
+            index.ordered.append((position, selector_type, name, pattern))
+        return index
+
+    def match(self, primitive: SvgPrimitive) -> MappingRule | None:
+        best = len(self.rules)
+        if self.tag_exact:
+            position = self.tag_exact.get(_fold_case(primitive.kind))
+            if position is not None:
+                best = position
+        if self.id_exact and primitive.element_id is not None:
+            position = self.id_exact.get(_fold_case(primitive.element_id))
+            if position is not None and position < best:
+                best = position
+        if primitive.classes and (self.class_exact or self.class_prefixes):
+            for cls in primitive.classes:
+                folded = _fold_case(cls)
+                position = self.class_exact.get(folded)
+                if position is not None and position < best:
+                    best = position
+                for prefix, position in self.class_prefixes:
+                    if position >= best:
+                        break
+                    if folded.startswith(prefix):
+                        best = position
+                        break
+        for position, selector_type, name, pattern in self.ordered:
+            if position >= best:
+                break
+            if matches_selector(primitive, selector_type, name, pattern):
+                best = position
+                break
+        return self.rules[best] if best < len(self.rules) else None
+
+
 @dataclass
 class MappingManager:
     rules: List[MappingRule] = field(default_factory=list)
@@ -168,19 +318,21 @@ class MappingManager:
     _material_alias: Dict[str, str] = field(default_factory=dict, init=False)
     _pattern_alias: Dict[str, str] = field(default_factory=dict, init=False)
     _font_alias: Dict[str, str] = field(default_factory=dict, init=False)
+    _resolve_cache: Dict[tuple, LayerAttributes] = field(default_factory=dict, init=False, repr=False)
+    _cache_rules: List[MappingRule] | None = field(default=None, init=False, repr=False)
+    _cache_key_fields: tuple[bool, tuple[str, ...], tuple[str, ...]] = field(default=(False, (), ()), init=False, repr=False)
+    _compiled_rules: List[CompiledRule] = field(default_factory=list, init=False, repr=False)
+    _rule_index: RuleIndex = field(default_factory=RuleIndex, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._reset_resolve_cache()
 
     @classmethod
     def with_defaults(cls, overrides: Iterable[MappingRule] | None = None) -> "MappingManager":
         materials_raw, patterns_raw, fonts_raw = _load_style_config()
         materials = _normalize_material_map(materials_raw)
-        patterns = {key: _coerce_pattern_entry(value) for key, value in DEFAULT_PATTERN_MAP.items()}
-        normalized_patterns = _normalize_pattern_map(patterns_raw)
-        for key, value in normalized_patterns.items():
-            patterns[key] = _coerce_pattern_entry(value)
-        fonts = {key: dict(value) for key, value in DEFAULT_FONT_MAP.items()}
-        normalized_fonts = _normalize_font_map(fonts_raw)
-        for key, value in normalized_fonts.items():
-            fonts[key] = dict(value)
+        patterns = {**_DEFAULT_PATTERN_COERCED, **_normalize_pattern_map(patterns_raw)}
+        fonts = {**DEFAULT_FONT_MAP, **_normalize_font_map(fonts_raw)}
 
         rules = cls.default_rules()
         if overrides:
@@ -197,62 +349,43 @@ class MappingManager:
 
     @staticmethod
     def default_rules() -> List[MappingRule]:
-        return [
-            MappingRule("class:IfcWall*", "A-WALL", "#000000", "Continuous", 0.35),
-            MappingRule("class:IfcSlab*", "A-SLAB", "#000000", "Continuous", 0.35),
-            MappingRule("class:IfcColumn*", "A-COLU", "#000000", "Continuous", 0.35),
-            MappingRule("class:IfcBeam*", "A-BEAM", "#000000", "Continuous", 0.35),
-            MappingRule("class:IfcDoor*", "A-DOOR", "#000000", "Continuous", 0.25),
-            MappingRule("class:IfcWindow*", "A-WIN", "#000000", "Continuous", 0.25),
-            MappingRule("class:PredefinedType-DIMENSION", "A-DIMS", "#000000", "Continuous", 0.18),
-            MappingRule("class:DIMENSION", "A-DIMS", "#000000", "Continuous", 0.18),
-            MappingRule("class:PredefinedType-TEXT", "A-ANNO", "#000000", "Continuous", 0.18),
-            MappingRule("class:annotation", "A-ANNO", "#000000", "Continuous", 0.18),
-            MappingRule("class:IfcAnnotation*", "A-ANNO", "#000000", "Continuous", 0.18),
-            MappingRule("class:GRID", "A-GRID", "#000000", "Continuous", 0.18),
-            MappingRule("class:PredefinedType-GRID", "A-GRID", "#000000", "Continuous", 0.18),
-            MappingRule("tag:text", "A-TEXT", "#000000", "Continuous", 0.18),
-            MappingRule("any", "0", "BYLAYER", "Continuous", None),
-        ]
-
-    def _rebuild_aliases(self) -> None:
-        self._material_alias = {key.lower(): key for key in self.material_layers}
-        self._pattern_alias = {key.lower(): key for key in self.pattern_map}
-        self._font_alias = {key.lower(): key for key in self.font_map}
+        return list(DEFAULT_RULES)
+
+    def _rebuild_aliases(self, which: str | None = None) -> None:
+        """Refresh the lower-case alias dict for ``which`` map ("material", "pattern", "font"), or all."""
+        if which in (None, "material"):
+            self._material_alias = {sys.intern(key.lower()): key for key in self.material_layers}
+            # Only material entries feed into resolve().
+            self._resolve_cache.clear()
+        if which in (None, "pattern"):
+            self._pattern_alias = {sys.intern(key.lower()): key for key in self.pattern_map}
+        if which in (None, "font"):
+            self._font_alias = {sys.intern(key.lower()): key for key in self.font_map}
 
     # Configuration management -------------------------------------------------
     def set_material_map(self, mapping: Dict[str, Dict[str, Any]]) -> None:
         self.material_layers = _normalize_material_map(mapping)
-        self._rebuild_aliases()
+        self._rebuild_aliases("material")
 
     def set_pattern_map(self, mapping: Dict[str, Dict[str, Any]]) -> None:
-        normalized = _normalize_pattern_map(mapping)
-        combined = {key: _coerce_pattern_entry(value) for key, value in DEFAULT_PATTERN_MAP.items()}
-        for key, value in normalized.items():
-            combined[key] = _coerce_pattern_entry(value)
-        self.pattern_map = combined
-        self._rebuild_aliases()
+        # Entries are shared with the defaults; nothing mutates them in place.
+        self.pattern_map = {**_DEFAULT_PATTERN_COERCED, **_normalize_pattern_map(mapping)}
+        self._rebuild_aliases("pattern")
 
     def set_font_map(self, mapping: Dict[str, Dict[str, Any]]) -> None:
-        normalized = _normalize_font_map(mapping)
-        combined = {key: dict(value) for key, value in DEFAULT_FONT_MAP.items()}
-        for key, value in normalized.items():
-            combined[key] = dict(value)
-        self.font_map = combined
-        self._rebuild_aliases()
+        self.font_map = {**DEFAULT_FONT_MAP, **_normalize_font_map(mapping)}
+        self._rebuild_aliases("font")
 
     def save_config(self) -> None:
         materials = {key: self._clean_dict(value) for key, value in self.material_layers.items()}
         patterns: Dict[str, Dict[str, Any]] = {}
         for key, value in self.pattern_map.items():
-            default = DEFAULT_PATTERN_MAP.get(key)
-            if default and self._dicts_equal(value, default):
+            if _canon(value) == _DEFAULT_PATTERN_CANON.get(key):
                 continue
             patterns[key] = self._clean_dict(value)
         fonts: Dict[str, Dict[str, Any]] = {}
         for key, value in self.font_map.items():
-            default = DEFAULT_FONT_MAP.get(key)
-            if default and self._dicts_equal(value, default):
+            if _canon(value) == _DEFAULT_FONT_CANON.get(key):
                 continue
             fonts[key] = self._clean_dict(value)
         data = {
@@ -262,6 +395,7 @@ class MappingManager:
         }
         STYLE_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
         STYLE_CONFIG_PATH.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+        _read_style_config.cache_clear()
 
     @staticmethod
     def _clean_dict(value: Dict[str, Any]) -> Dict[str, Any]:
@@ -275,23 +409,6 @@ class MappingManager:
                 cleaned[key] = val
         return cleaned
 
-    @staticmethod
-    def _dicts_equal(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
-        keys = set(a.keys()) | set(b.keys())
-        for key in keys:
-            va = a.get(key)
-            vb = b.get(key)
-            if isinstance(va, (int, float)) or isinstance(vb, (int, float)):
-                try:
-                    if float(va) == float(vb):
-                        continue
-                except (TypeError, ValueError):
-                    return False
-                return False
-            if va != vb:
-                return False
-        return True
-
     def get_material_map(self) -> Dict[str, Dict[str, Any]]:
         return {key: dict(value) for key, value in self.material_layers.items()}
 
@@ -303,19 +420,58 @@ class MappingManager:
 
     # Resolution ----------------------------------------------------------------
     def resolve(self, primitive: SvgPrimitive) -> LayerAttributes:
-        material_classes = [cls for cls in primitive.classes if cls.startswith("material-")]
-        if material_classes:
-            material = material_classes[0]
-            return self._material_attributes(material, primitive)
-
-        for rule in self.rules:
-            if self._matches_selector(primitive, rule.selector):
-                return LayerAttributes(
-                    layer=rule.layer or "0",
-                    color=rule.color or self._color_from_style(primitive),
-                    linetype=rule.linetype or self._linetype_from_style(primitive),
-                    lineweight_mm=rule.lineweight_mm if rule.lineweight_mm is not None else self._lineweight_from_style(primitive),
-                )
+        # Assigning a new rules list invalidates the cache; the list itself is never edited in place.
+        if self.rules is not self._cache_rules:
+            self._reset_resolve_cache()
+        key = self._resolve_key(primitive)
+        attrs = self._resolve_cache.get(key)
+        if attrs is None:
+            attrs = self._resolve_uncached(primitive)
+            self._resolve_cache[key] = attrs
+        return attrs
+
+    def _reset_resolve_cache(self) -> None:
+        """Drop memoized results and recompile the selectors of the current rules."""
+        compiled = [(rule, *selector) for rule in self.rules if (selector := compile_selector(rule.selector))]
+        uses_id = any(entry[1] == "id" for entry in compiled)
+        attr_names = sorted({entry[2] for entry in compiled if entry[1] == "attr"})
+        style_names = sorted({entry[2] for entry in compiled if entry[1] == "style"})
+        self._compiled_rules = compiled
+        self._rule_index = RuleIndex.build(compiled)
+        self._cache_key_fields = (uses_id, tuple(attr_names), tuple(style_names))
+        self._cache_rules = self.rules
+        self._resolve_cache.clear()
+
+    def _resolve_key(self, primitive: SvgPrimitive) -> tuple:
+        uses_id, attr_names, style_names = self._cache_key_fields
+        style = primitive.style
+        key: tuple = (
+            primitive.classes,
+            primitive.kind,
+            primitive.element_id if uses_id else None,
+            style.get("stroke"),
+            style.get("fill"),
+            style.get("stroke-width"),
+            style.get("stroke-dasharray"),
+        )
+        if attr_names:
+            key += tuple(_hashable(primitive.attributes.get(name)) for name in attr_names)
+        if style_names:
+            key += tuple(_hashable(style.get(name)) for name in style_names)
+        return key
+
+    def _resolve_uncached(self, primitive: SvgPrimitive) -> LayerAttributes:
+        if primitive.material_class:
+            return self._material_attributes(primitive.material_class, primitive)
+
+        rule = self._rule_index.match(primitive)
+        if rule is not None:
+            return LayerAttributes(
+                layer=rule.layer or "0",
+                color=rule.color or self._color_from_style(primitive),
+                linetype=rule.linetype or self._linetype_from_style(primitive),
+                lineweight_mm=rule.lineweight_mm if rule.lineweight_mm is not None else self._lineweight_from_style(primitive),
+            )
 
         return LayerAttributes(
             layer="0",
@@ -324,89 +480,50 @@ class MappingManager:
             lineweight_mm=self._lineweight_from_style(primitive),
         )
 
-    def _matches_selector(self, primitive: SvgPrimitive, selector: str) -> bool:
-        selector = selector.strip()
-        if not selector:
-            return False
-        if selector.lower() == "any":
-            return True
-        if ":" not in selector:
-            return False
-        selector_type, selector_value = selector.split(":", 1)
-        selector_type = selector_type.strip().lower()
-        selector_value = selector_value.strip()
-        if selector_type == "class":
-            return any(fnmatch.fnmatch(cls, selector_value) for cls in primitive.classes)
-        if selector_type == "tag":
-            return fnmatch.fnmatch(primitive.kind, selector_value)
-        if selector_type == "id":
-            return primitive.element_id is not None and fnmatch.fnmatch(primitive.element_id, selector_value)
-        if selector_type == "attr" and "=" in selector_value:
-            name, value = [part.strip() for part in selector_value.split("=", 1)]
-            attr_value = primitive.attributes.get(name)
-            return attr_value is not None and fnmatch.fnmatch(str(attr_value), value)
-        if selector_type == "style" and "=" in selector_value:
-            name, value = [part.strip() for part in selector_value.split("=", 1)]
-            style_value = primitive.style.get(name)
-            return style_value is not None and fnmatch.fnmatch(str(style_value), value)
-        return False
-
     @staticmethod
     def _color_from_style(primitive: SvgPrimitive) -> str:
-        value = primitive.style.get("stroke")
-        if isinstance(value, str):
-            value = value.strip()
-        if isinstance(value, str) and value not in {"none", "transparent"} and value.startswith("#"):
-            return normalize_hex(value)
-        fill = primitive.style.get("fill")
-        if isinstance(fill, str):
-            fill = fill.strip()
-        if isinstance(fill, str) and fill not in {"none", "transparent"} and fill.startswith("#"):
-            return normalize_hex(fill)
+        style = primitive.resolved_style
+        if style.stroke.startswith("#"):
+            return normalize_hex(style.stroke)
+        if style.fill.startswith("#"):
+            return normalize_hex(style.fill)
         return "BYLAYER"
 
     @staticmethod
     def _lineweight_from_style(primitive: SvgPrimitive) -> float | None:
-        value = primitive.style.get("stroke-width")
-        if not value:
-            return None
-        value = str(value).strip()
-        try:
-            return float(value)
-        except ValueError:
-            try:
-                return parse_length(value)
-            except Exception:
-                return None
+        return primitive.resolved_style.stroke_width
 
     @staticmethod
     def _linetype_from_style(primitive: SvgPrimitive) -> str:
-        dash = primitive.style.get("stroke-dasharray")
-        if dash and dash not in {"none", "0"}:
-            return "DASHED"
-        return "Continuous"
+        return "DASHED" if primitive.resolved_style.is_dashed else "Continuous"
 
     def _material_attributes(self, material_class: str, primitive: SvgPrimitive) -> LayerAttributes:
-        key = self._material_alias.get(material_class.lower())
+        key = self._material_alias.get(_lower(material_class))
         short = None
         if not key and "-" in material_class:
             short = material_class.split("-", 1)[1]
-            key = self._material_alias.get(short.lower())
+            key = self._material_alias.get(_lower(short))
         config = self.material_layers.get(key) if key else None
 
         short_key = short or (material_class.split("-", 1)[1] if "-" in material_class else material_class)
         default_layer = f"MAT-{_sanitize_layer_name(short_key)}"
-        default_color = self._color_from_style(primitive)
-        default_lineweight = self._lineweight_from_style(primitive)
         default_linetype = "Continuous"
 
         if config is None:
-            return LayerAttributes(layer=default_layer, color=default_color, linetype=default_linetype, lineweight_mm=default_lineweight)
+            return LayerAttributes(
+                layer=default_layer,
+                color=self._color_from_style(primitive),
+                linetype=default_linetype,
+                lineweight_mm=self._lineweight_from_style(primitive),
+            )
 
         layer = config.get("layer", default_layer)
-        color = parse_color_spec(config.get("color"), default_color)
+        # Style-derived defaults are only computed when the material entry leaves them out.
+        color = parse_color_spec(config.get("color"))
+        if color is None:
+            color = self._color_from_style(primitive)
         linetype = config.get("linetype", default_linetype)
-        lineweight = default_lineweight
+        lineweight: float | None = None
         lw_value = config.get("lineweight")
         if isinstance(lw_value, (int, float)):
             lineweight = float(lw_value)
@@ -418,6 +535,8 @@ class MappingManager:
                     lineweight = parse_length(lw_value)
                 except Exception:
                     pass
+        if lineweight is None:
+            lineweight = self._lineweight_from_style(primitive)
 
         return LayerAttributes(layer=layer, color=color, linetype=linetype, lineweight_mm=lineweight)
 
@@ -433,12 +552,12 @@ class MappingManager:
             inside = inside[1:]
         if not inside:
             return None
-        return inside.lower()
+        return _lower(inside)
 
     def resolve_pattern(self, pattern_id: str | None) -> Dict[str, Any] | None:
         if not pattern_id:
             return None
-        key = self._pattern_alias.get(pattern_id.lower())
+        key = self._pattern_alias.get(_lower(pattern_id))
         if not key:
             return None
         return self.pattern_map.get(key)
@@ -449,7 +568,7 @@ class MappingManager:
     def resolve_font(self, font_family: str | None) -> Dict[str, Any] | None:
         if not font_family:
             return None
-        key = self._font_alias.get(font_family.lower())
+        key = self._font_alias.get(_lower(font_family))
         if not key:
             return None
         entry = self.font_map.get(key)
@@ -465,36 +584,97 @@ class MappingManager:
         return list(self.rules)
 
 
+def compile_selector(selector: str) -> CompiledSelector | None:
+    """Parse a rule selector once into ``(type, name, pattern)``; ``None`` never matches."""
+    selector = selector.strip()
+    if not selector:
+        return None
+    if selector.lower() == "any":
+        return "any", None, None, None
+    if ":" not in selector:
+        return None
+    selector_type, selector_value = selector.split(":", 1)
+    selector_type = selector_type.strip().lower()
+    selector_value = sys.intern(selector_value.strip())
+    if selector_type in {"class", "tag", "id"}:
+        return selector_type, None, selector_value, _compile_glob(selector_value)
+    if selector_type in {"attr", "style"} and "=" in selector_value:
+        name, value = [part.strip() for part in selector_value.split("=", 1)]
+        return selector_type, name, value, _compile_glob(value)
+    return None
+
+
+def matches_selector(
+    primitive: SvgPrimitive,
+    selector_type: str,
+    name: str | None,
+    pattern: Pattern[str] | None,
+) -> bool:
+    if selector_type == "any":
+        return True
+    if selector_type == "class":
+        return any(pattern.match(cls) for cls in primitive.classes)
+    if selector_type == "tag":
+        return pattern.match(primitive.kind) is not None
+    if selector_type == "id":
+        return primitive.element_id is not None and pattern.match(primitive.element_id) is not None
+    if selector_type == "attr":
+        attr_value = primitive.attributes.get(name)
+        return attr_value is not None and pattern.match(str(attr_value)) is not None
+    if selector_type == "style":
+        style_value = primitive.style.get(name)
+        return style_value is not None and pattern.match(str(style_value)) is not None
+    return False
+
+
+def _compile_glob(pattern: str) -> Pattern[str]:
+    # fnmatch.fnmatch normalizes case on platforms with case-insensitive paths (Windows).
+    return re.compile(fnmatch.translate(pattern), _GLOB_FLAGS)
+
+
+def _has_glob_magic(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
+def _fold_case(value: str) -> str:
+    return value.lower() if _GLOB_FLAGS else value
+
+
+def _lower(value: str) -> str:
+    # Alias keys are usually lower-case already; skip allocating a copy for them.
+    return value if value.islower() else value.lower()
+
+
+def _hashable(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return str(value)
+    return value
+
+
+@lru_cache(maxsize=256)
 def _sanitize_layer_name(value: str) -> str:
-    sanitized = []
-    for char in value.upper():
-        if char.isalnum() or char in "-_":
-            sanitized.append(char)
-        else:
-            sanitized.append("_")
-    return "".join(sanitized) or "MATERIAL"
+    return _LAYER_NAME_INVALID_RE.sub("_", value.upper()) or "MATERIAL"
 
 
+@lru_cache(maxsize=256)
 def sanitize_style_name(name: str) -> str:
-    sanitized = []
-    for char in name.strip():
-        if char.isalnum() or char in "-_":
-            sanitized.append(char)
-        elif char == " ":
-            sanitized.append("_")
-    value = "".join(sanitized)
+    value = _STYLE_NAME_INVALID_RE.sub("", name.strip()).replace(" ", "_")
     return value[:31] if value else "STANDARD"
 
 
+@lru_cache(maxsize=2048)
 def parse_color_spec(value: str | None, fallback: str | None = None) -> str | None:
     if not value:
         return fallback
     spec = value.strip()
     if not spec:
         return fallback
-    if spec.lower() == "bylayer":
+    lowered = _lower(spec)
+    if lowered == "bylayer":
         return "BYLAYER"
-    if spec.lower() == "byblock":
+    if lowered == "byblock":
         return "BYBLOCK"
     if spec.isdigit():
         try:
@@ -508,7 +688,7 @@ def parse_color_spec(value: str | None, fallback: str | None = None) -> str | No
             return normalize_hex(spec)
         except ValueError:
             return fallback
-    css = CSS_COLOR_MAP.get(spec.lower())
+    css = CSS_COLOR_MAP.get(lowered)
     if css:
         return css
     return fallback
@@ -518,9 +698,9 @@ def normalize_hex(value: str) -> str:
     if not value.startswith("#"):
         raise ValueError("Not a hex color")
     hex_value = value[1:]
-    if len(hex_value) == 3:
-        hex_value = "".join(ch * 2 for ch in hex_value)
-    if len(hex_value) != 6:
+    if not _HEX_COLOR_RE.fullmatch(hex_value):
         raise ValueError("Hex color must be 3 or 6 digits")
-    int(hex_value, 16)
-    return f"#{hex_value.upper()}"
+    number = int(hex_value, 16)
+    if len(hex_value) == 3:
+        number = ((number & 0xF00) * 0x1100) | ((number & 0x0F0) * 0x110) | ((number & 0x00F) * 0x11)
+    return f"#{number:06X}"
@@ -1,24 +1,132 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+import numpy as np
+
+EMPTY_PAINT_VALUES = frozenset({"", "none", "transparent"})
+HAIRLINE_STROKE_MM = 0.1
 
 Point = Tuple[float, float]
+PointArray = np.ndarray  # (N, 2) float64
 ColorRGB = Tuple[int, int, int]
+# Exactly six hex digits; int(..., 16) alone would also take signs, underscores and whitespace.
+_RGB_HEX_RE = re.compile(r"[0-9A-Fa-f]{6}")
 
+UNIT_CONVERSIONS = {
+    "mm": 1.0,
+    "cm": 10.0,
+    "in": 25.4,
+    "pt": 25.4 / 72.0,
+    "pc": 25.4 / 6.0,
+    "px": 25.4 / 96.0,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class ResolvedStyle:
+    """Stroke/fill values of a primitive, normalized once for the writer and mapping."""
+
+    fill: str = ""
+    fill_norm: str = ""
+    stroke: str = ""
+    stroke_norm: str = ""
+    stroke_width: float | None = None
+    is_dashed: bool = False
+
+    @classmethod
+    def from_style(cls, style: Dict[str, Any]) -> "ResolvedStyle":
+        fill = _style_text(style.get("fill"))
+        stroke = _style_text(style.get("stroke"))
+        stroke_width = None
+        width_value = style.get("stroke-width")
+        if width_value:
+            width_text = str(width_value).strip()
+            try:
+                stroke_width = float(width_text)
+            except ValueError:
+                stroke_width = parse_length(width_text)
+        dash = style.get("stroke-dasharray")
+        return cls(
+            fill=fill,
+            fill_norm=fill.lower(),
+            stroke=stroke,
+            stroke_norm=stroke.lower(),
+            stroke_width=stroke_width,
+            is_dashed=bool(dash) and dash not in {"none", "0"},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PolylinePlan:
+    """Which DXF entities a polyline primitive produces; independent of the mapping rules."""
+
+    closed: bool = False
+    has_fill: bool = False
+    skip: bool = False
+    skip_boundary: bool = False
+
+    @classmethod
+    def from_primitive(cls, primitive: "SvgPrimitive") -> "PolylinePlan":
+        extra = primitive.extra
+        closed = bool(extra.get("closed")) if isinstance(extra, dict) else False
+        style = primitive.resolved_style
+        has_fill = closed and style.fill_norm not in EMPTY_PAINT_VALUES
+        hidden_stroke = style.stroke_norm in EMPTY_PAINT_VALUES or (
+            style.stroke_width is not None and style.stroke_width <= HAIRLINE_STROKE_MM
+        )
+        is_material = primitive.material_class is not None
+        # Projection lines between pieces of the same material are seams, not edges.
+        skip = not closed and is_material and hidden_stroke and "projection" in primitive.classes_set
+        skip_boundary = has_fill and is_material and hidden_stroke and "cut" not in primitive.classes_set
+        return cls(closed=closed, has_fill=has_fill, skip=skip, skip_boundary=skip_boundary)
+
+
+def _style_text(value: Any) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+@dataclass(slots=True)
 class SvgPrimitive:
     """Normalized SVG primitive ready for DXF conversion."""
 
     kind: str
-    points: List[Point] = field(default_factory=list)
+    points: PointArray = field(default_factory=lambda: np.empty((0, 2), dtype=np.float64))
+    # The loader shares one style dict between primitives with identical styles; copy before mutating.
     style: Dict[str, Any] = field(default_factory=dict)
     classes: Tuple[str, ...] = field(default_factory=tuple)
     element_id: str | None = None
     attributes: Dict[str, Any] = field(default_factory=dict)
     extra: Dict[str, Any] = field(default_factory=dict)
+    classes_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    material_class: str | None = field(init=False, repr=False, compare=False)
+    _resolved_style: ResolvedStyle | None = field(default=None, init=False, repr=False, compare=False)
+    _polyline_plan: PolylinePlan | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Points are stored as one contiguous (N, 2) array so writers can hand them to ezdxf as a block.
+        self.points = np.asarray(self.points, dtype=np.float64).reshape(-1, 2)
+        # Class lookups happen for every primitive during conversion; precompute them once.
+        self.classes_set = frozenset(self.classes)
+        self.material_class = next((cls for cls in self.classes if cls.startswith("material-")), None)
+
+    @property
+    def resolved_style(self) -> ResolvedStyle:
+        # Slots leave no __dict__ for cached_property, so the cache lives in a private field.
+        if self._resolved_style is None:
+            self._resolved_style = ResolvedStyle.from_style(self.style)
+        return self._resolved_style
+
+    @property
+    def polyline_plan(self) -> PolylinePlan:
+        # Cached on the primitive so repeated conversions of a loaded document skip it.
+        if self._polyline_plan is None:
+            self._polyline_plan = PolylinePlan.from_primitive(self)
+        return self._polyline_plan
 
     def label(self) -> str:
         """Human readable name for logs."""
@@ -41,59 +149,92 @@ class SvgDocument:
     css_files: List[Path] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     warnings: List[str] = field(default_factory=list)
+    _entity_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _classes_seen: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _indexed: int = field(default=0, init=False, repr=False, compare=False)
 
-    def summary(self) -> "SvgDocumentSummary":
-        counts: Dict[str, int] = {}
-        for primitive in self.primitives:
+    def add_primitives(self, primitives: Iterable[SvgPrimitive]) -> None:
+        self.primitives.extend(primitives)
+        self._index_primitives()
+
+    def _index_primitives(self) -> None:
+        # Counts and classes are kept incrementally; this also catches primitives appended to the list directly.
+        if len(self.primitives) < self._indexed:
+            self._entity_counts.clear()
+            self._classes_seen.clear()
+            self._indexed = 0
+        counts = self._entity_counts
+        for primitive in self.primitives[self._indexed:]:
             counts[primitive.kind] = counts.get(primitive.kind, 0) + 1
+            self._classes_seen.update(primitive.classes)
+        self._indexed = len(self.primitives)
+
+    def summary(self) -> "SvgDocumentSummary":
+        self._index_primitives()
         return SvgDocumentSummary(
             path=self.path,
-            entity_counts=counts,
+            entity_counts=dict(self._entity_counts),
             total_entities=len(self.primitives),
-            warnings=list(self.warnings),
+            warnings=self.warnings,
             known_classes=self.collect_classes(),
+            warning_count=len(self.warnings),
         )
 
     def collect_classes(self) -> List[str]:
-        seen: set[str] = set()
-        for primitive in self.primitives:
-            seen.update(primitive.classes)
-        return sorted(seen)
+        self._index_primitives()
+        return sorted(self._classes_seen)
 
 
-@dataclass
+@dataclass(slots=True)
 class SvgDocumentSummary:
     path: Path
     entity_counts: Dict[str, int]
     total_entities: int
+    # Shared with the loaded document rather than copied; treat as read-only.
     warnings: List[str] = field(default_factory=list)
     known_classes: List[str] = field(default_factory=list)
+    warning_count: int = 0
 
     def format_counts(self) -> str:
         return ", ".join(f"{k}: {v}" for k, v in sorted(self.entity_counts.items()))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MappingRule:
     selector: str
     layer: str
     color: str = "BYLAYER"
     linetype: str = "Continuous"
     lineweight_mm: float | None = None
+    _row: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-    def as_row(self) -> List[str]:
+    def __post_init__(self) -> None:
+        # Immutable, so the table row (with its formatted lineweight) is built once per rule.
         weight = "" if self.lineweight_mm is None else f"{self.lineweight_mm:.2f}"
-        return [self.selector, self.layer, self.color, self.linetype, weight]
+        object.__setattr__(self, "_row", (self.selector, self.layer, self.color, self.linetype, weight))
 
+    def as_row(self) -> List[str]:
+        return list(self._row)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LayerAttributes:
+    """Resolved DXF layer setup; frozen because resolve() hands one instance to many primitives."""
+
     layer: str
     color: str = "BYLAYER"
     linetype: str = "Continuous"
     lineweight_mm: float | None = None
+    _dxf_attribs: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Immutable, so the DXF attribs can be built once instead of per written entity.
+        object.__setattr__(self, "_dxf_attribs", self._build_dxf_attribs())
 
     def to_dxf_attribs(self) -> Dict[str, Any]:
+        return dict(self._dxf_attribs)
+
+    def _build_dxf_attribs(self) -> Dict[str, Any]:
         attribs: Dict[str, Any] = {"layer": self.layer}
         if self.color and self.color.upper() not in {"BYLAYER", "BYBLOCK"}:
             if self.color.isdigit():
@@ -114,9 +255,10 @@ class LayerAttributes:
 class ConversionOptions:
     output_path: Path
     mapping_rules: Iterable[MappingRule] = field(default_factory=list)
+    verbose: bool = True  # False skips per-entity log messages for bulk conversions
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     output_path: Path
     written_entities: int
@@ -125,19 +267,45 @@ class ConversionResult:
     warnings: List[str] = field(default_factory=list)
 
 
+@lru_cache(maxsize=512)
 def parse_rgb(value: str) -> int:
     """Convert color hex value (#RRGGBB) to DXF true color integer."""
     value = value.strip()
     if value.startswith("#"):
         value = value[1:]
-    if len(value) != 6:
+    if not _RGB_HEX_RE.fullmatch(value):
         raise ValueError(f"Unsupported color value: {value}")
-    r = int(value[0:2], 16)
-    g = int(value[2:4], 16)
-    b = int(value[4:6], 16)
-    return (r << 16) + (g << 8) + b
+    # 0xRRGGBB is already the DXF true color layout.
+    return int(value, 16)
 
 
 def lineweight_to_hundredths_mm(weight_mm: float) -> int:
     """Convert millimeter lineweight to DXF integer (1/100 mm)."""
     return int(round(weight_mm * 100))
+
+
+_ASCII_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def parse_length(value: str | None) -> float:
+    if not value:
+        return 0.0
+    value = value.strip()
+    if not value[-1:].isalpha():
+        # Unitless lengths (the common case for element attributes) need no unit scan.
+        try:
+            return float(value)
+        except ValueError:
+            return 0.0
+    unit = "".join(ch for ch in value if ch.isalpha())
+    number = value.rstrip(_ASCII_LETTERS)
+    try:
+        magnitude = float(number)
+    except ValueError:
+        return 0.0
+    if not unit:
+        return magnitude
+    factor = UNIT_CONVERSIONS.get(unit.lower())
+    if not factor:
+        return magnitude
+    return magnitude * factor
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from math import acos, degrees, hypot, isclose
-from typing import List, Tuple
+from functools import partial
+from math import cos, isclose, radians
+from typing import List, Sequence, Tuple
 
+import numpy as np
 from svgpathtools import Path, parse_path
 
-from .models import Point
+from .models import Point, PointArray
+
+# Below this many paths, process start-up and pickling cost more than the sampling itself.
+PARALLEL_PATH_THRESHOLD = 256
+PARALLEL_CHUNK_SIZE = 64
 
 
 @dataclass
 class PolylineApproximation:
-    points: List[Point]
+    points: PointArray  # (N, 2) float64, ready for transform_array
     closed: bool = False
 
 
@@ -37,11 +44,11 @@ def path_to_polylines(path_data: str, max_segment_length: float = 0.5, min_sampl
     warnings: List[str] = []
 
     for subpath in svg_path.continuous_subpaths():
-        if isclose(subpath.length(), 0.0, rel_tol=1e-9):
+        points, length = _sample_subpath(subpath, max_segment_length, min_samples)
+        if isclose(length, 0.0, rel_tol=1e-9):
             continue
-        points = _sample_subpath(subpath, max_segment_length, min_samples)
         closed = bool(subpath.isclosed())
-        simplified = simplify_polyline(points, closed=closed)
+        simplified = simplify_polyline_array(np.asarray(points, dtype=np.float64), closed=closed)
         polylines.append(PolylineApproximation(points=simplified, closed=closed))
 
     if not polylines:
@@ -50,70 +57,109 @@ def path_to_polylines(path_data: str, max_segment_length: float = 0.5, min_sampl
     return polylines, warnings
 
 
-def _sample_subpath(subpath: Path, max_segment_length: float, min_samples: int) -> List[Point]:
+def paths_to_polylines_batch(
+    path_data_list: Sequence[str],
+    max_segment_length: float = 0.5,
+    min_samples: int = 8,
+    max_workers: int | None = None,
+) -> List[Tuple[List[PolylineApproximation], List[str]]]:
+    """
+    Approximate many SVG paths, in worker processes when the batch is large.
+
+    Results are returned in input order, one ``path_to_polylines`` result per entry.
+    """
+    convert = partial(path_to_polylines, max_segment_length=max_segment_length, min_samples=min_samples)
+    if len(path_data_list) < PARALLEL_PATH_THRESHOLD or max_workers == 1:
+        return [convert(path_data) for path_data in path_data_list]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(convert, path_data_list, chunksize=PARALLEL_CHUNK_SIZE))
+
+
+def _sample_subpath(subpath: Path, max_segment_length: float, min_samples: int) -> Tuple[List[Point], float]:
+    """Sample a subpath; also returns its length so callers need not integrate it a second time."""
     points: List[Point] = []
     current_point = subpath[0].start if len(subpath) else complex(0, 0)
     points.append((float(current_point.real), float(current_point.imag)))
 
+    total_length = 0.0
     for segment in subpath:
-        seg_length = float(segment.length())
+        is_line = segment.__class__.__name__ == "Line"
+        seg_length = float(abs(segment.end - segment.start)) if is_line else float(segment.length())
         if seg_length == 0:
             continue
-        if segment.__class__.__name__ == "Line":
+        total_length += seg_length
+        if is_line:
             complex_point = segment.end
             points.append((float(complex_point.real), float(complex_point.imag)))
             continue
         steps = max(int(seg_length / max_segment_length) + 1, 1)
         if seg_length > max_segment_length:
             steps = max(steps, min_samples)
-        for step in range(1, steps + 1):
-            t = min(1.0, step / steps)
-            complex_point = segment.point(t)
+        sampled = _sample_bezier(segment, steps)
+        if sampled is not None:
+            points.extend(zip(sampled.real.tolist(), sampled.imag.tolist()))
+            continue
+        # step / steps stays below 1.0 inside the loop; the end point is emitted once at t = 1.0.
+        for step in range(1, steps):
+            complex_point = segment.point(step / steps)
             points.append((float(complex_point.real), float(complex_point.imag)))
-    return points
+        complex_point = segment.point(1.0)
+        points.append((float(complex_point.real), float(complex_point.imag)))
+    return points, total_length
+
+
+def _sample_bezier(segment, steps: int) -> np.ndarray | None:
+    """Evaluate a Bezier segment at t = 1/steps .. 1 in one pass; ``None`` for other segment types."""
+    name = segment.__class__.__name__
+    if name == "CubicBezier":
+        p0, p1, p2, p3 = segment.start, segment.control1, segment.control2, segment.end
+        t = np.arange(1, steps + 1, dtype=float) / steps
+        # Same Horner form as CubicBezier.point, so samples match the scalar path.
+        return p0 + t * (3 * (p1 - p0) + t * (3 * (p0 + p2) - 6 * p1 + t * (-p0 + 3 * (p1 - p2) + p3)))
+    if name == "QuadraticBezier":
+        p0, p1, p2 = segment.start, segment.control, segment.end
+        t = np.arange(1, steps + 1, dtype=float) / steps
+        tc = 1 - t
+        return tc * tc * p0 + 2 * tc * t * p1 + t * t * p2
+    return None
 
 
 def simplify_polyline(points: List[Point], *, closed: bool = False, angle_tol: float = 0.5, min_segment: float = 0.05) -> List[Point]:
     if len(points) < 3:
         return points
+    simplified = simplify_polyline_array(np.asarray(points, dtype=np.float64), closed=closed, angle_tol=angle_tol, min_segment=min_segment)
+    return list(zip(simplified[:, 0].tolist(), simplified[:, 1].tolist()))
 
-    simplified: List[Point] = []
-    total = len(points)
-
-    def segment_length(p1: Point, p2: Point) -> float:
-        return hypot(p2[0] - p1[0], p2[1] - p1[1])
 
-    def angle(p_prev: Point, p_curr: Point, p_next: Point) -> float:
-        v1 = (p_curr[0] - p_prev[0], p_curr[1] - p_prev[1])
-        v2 = (p_next[0] - p_curr[0], p_next[1] - p_curr[1])
-        len1 = hypot(*v1)
-        len2 = hypot(*v2)
-        if len1 < min_segment or len2 < min_segment or len1 == 0 or len2 == 0:
-            return 180.0
-        cos_val = max(-1.0, min(1.0, (v1[0] * v2[0] + v1[1] * v2[1]) / (len1 * len2)))
-        return degrees(acos(cos_val))
+def simplify_polyline_array(points: np.ndarray, *, closed: bool = False, angle_tol: float = 0.5, min_segment: float = 0.05) -> np.ndarray:
+    """Array form of :func:`simplify_polyline`; takes and returns an (N, 2) block."""
+    if len(points) < 3:
+        return points
 
-    indices = range(total)
     if closed:
         # Avoid duplicating the last point for closed shapes; treat wrap-around angles.
-        core_points = points[:-1] if points[0] == points[-1] else points
-        total = len(core_points)
-        simplified.append(core_points[0])
-        for i in range(1, total):
-            prev_pt = core_points[i - 1]
-            curr_pt = core_points[i]
-            next_pt = core_points[(i + 1) % total]
-            if angle(prev_pt, curr_pt, next_pt) > angle_tol:
-                simplified.append(curr_pt)
-        if simplified[0] != simplified[-1]:
-            simplified.append(simplified[0])
+        core = points[:-1] if np.array_equal(points[0], points[-1]) else points
+        keep = _corner_mask(core[:-1], core[1:], np.roll(core, -1, axis=0)[1:], angle_tol, min_segment)
+        simplified = core[np.concatenate(([0], np.flatnonzero(keep) + 1))]
+        if not np.array_equal(simplified[0], simplified[-1]):
+            simplified = np.vstack((simplified, simplified[:1]))
     else:
-        simplified.append(points[0])
-        for i in range(1, len(points) - 1):
-            prev_pt = points[i - 1]
-            curr_pt = points[i]
-            next_pt = points[i + 1]
-            if angle(prev_pt, curr_pt, next_pt) > angle_tol:
-                simplified.append(curr_pt)
-        simplified.append(points[-1])
+        keep = _corner_mask(points[:-2], points[1:-1], points[2:], angle_tol, min_segment)
+        simplified = points[np.concatenate(([0], np.flatnonzero(keep) + 1, [len(points) - 1]))]
     return simplified
+
+
+def _corner_mask(prev_pts: np.ndarray, curr_pts: np.ndarray, next_pts: np.ndarray, angle_tol: float, min_segment: float) -> np.ndarray:
+    """Flag each vertex whose turn exceeds ``angle_tol`` degrees or that borders a too-short segment."""
+    v1 = curr_pts - prev_pts
+    v2 = next_pts - curr_pts
+    len1_sq = v1[:, 0] * v1[:, 0] + v1[:, 1] * v1[:, 1]
+    len2_sq = v2[:, 0] * v2[:, 0] + v2[:, 1] * v2[:, 1]
+    min_segment_sq = min_segment * min_segment
+    short = (len1_sq < min_segment_sq) | (len2_sq < min_segment_sq) | (len1_sq == 0) | (len2_sq == 0)
+    # angle > tol  <=>  cos < cos(tol)  <=>  dot < cos_tol * |v1| * |v2|; x * |x| is monotonic,
+    # so squaring both sides that way keeps the sign and avoids sqrt/acos.
+    dot = v1[:, 0] * v2[:, 0] + v1[:, 1] * v2[:, 1]
+    cos_tol = cos(radians(angle_tol))
+    turned = dot * np.abs(dot) < cos_tol * abs(cos_tol) * len1_sq * len2_sq
+    return np.where(short, 180.0 > angle_tol, turned)
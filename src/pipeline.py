@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Iterable, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Tuple
 
-from .dxf_writer import DxfWriter
 from .mapping import MappingManager
 from .models import ConversionOptions, ConversionResult, MappingRule, SvgDocument, SvgDocumentSummary
-from .svg_loader import SvgLoader
+
+if TYPE_CHECKING:
+    from .svg_loader import SvgLoader
+
+# The loader (svgpathtools, which pulls in scipy) and the writer (ezdxf) dominate import time;
+# they are imported on first load/convert so the window can come up without them.
 
 
 class PipelineController:
@@ -16,18 +20,41 @@ class PipelineController:
         if default_css.exists() and default_css not in css_paths:
             css_paths.append(default_css)
         self.css_paths = css_paths
-        self.loader = SvgLoader(css_files=self.css_paths)
+        self._loader: SvgLoader | None = None
         self.mapping_manager = MappingManager.with_defaults()
 
+    @property
+    def loader(self) -> SvgLoader:
+        if self._loader is None:
+            from .svg_loader import SvgLoader
+
+            self._loader = SvgLoader(css_files=self.css_paths)
+        return self._loader
+
     def load_svg(self, path: Path) -> Tuple[SvgDocument, SvgDocumentSummary]:
         document = self.loader.load(path)
         summary = document.summary()
         return document, summary
 
-    def convert(self, document: SvgDocument, output_path: Path, rules: Iterable[MappingRule] | None = None) -> ConversionResult:
+    def load_svg_bytes(self, data: bytes, path: Path) -> Tuple[SvgDocument, SvgDocumentSummary]:
+        document = self.loader.load(path, data)
+        return document, document.summary()
+
+    def convert(
+        self,
+        document: SvgDocument,
+        output_path: Path,
+        rules: Iterable[MappingRule] | None = None,
+        verbose: bool = True,
+    ) -> ConversionResult:
         if rules is not None:
-            self.mapping_manager.rules = list(rules)
-        options = ConversionOptions(output_path=output_path, mapping_rules=self.mapping_manager.to_rules())
+            rules = list(rules)
+            # Keep the manager's list (and its compiled selectors) when the rules did not change.
+            if rules != self.mapping_manager.rules:
+                self.mapping_manager.rules = rules
+        options = ConversionOptions(output_path=output_path, mapping_rules=self.mapping_manager.to_rules(), verbose=verbose)
+        from .dxf_writer import DxfWriter
+
         writer = DxfWriter()
         return writer.write(document, options, self.mapping_manager)
 
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
 
 from lxml import etree
 
 CSS_RULE_RE = re.compile(r"(?P<selectors>[^{}]+)\{(?P<body>[^{}]+)\}")
 COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+# One ``name: value`` declaration; the name stops at the first colon, the value at the next semicolon.
+DECLARATION_RE = re.compile(r"([^:;]*):([^;]*)")
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def local_name(tag: str) -> str:
+    """Lower-cased local part of an lxml ``{namespace}name`` tag; SVG files use only a handful."""
+    return tag.rpartition("}")[2].lower()
+
+
+@dataclass(frozen=True)
 class CssRule:
     selector_type: str
     selector_value: str
@@ -23,6 +33,13 @@ class StyleResolver:
 
     def __init__(self, css_files: Iterable[Path] | None = None):
         self.rules: List[CssRule] = []
+        # Rules bucketed by selector so resolve() only visits candidates; entries are (rule position, properties).
+        self._universal: List[Tuple[int, Dict[str, Any]]] = []
+        self._by_tag: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self._by_class: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self._by_id: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        # CSS-only style per (tag, matching classes, matching id); elements mostly share a few combinations.
+        self._css_cache: Dict[Tuple[str, FrozenSet[str], str | None], Dict[str, Any]] = {}
         css_files = list(css_files or [])
         for path in css_files:
             if path.exists():
@@ -32,26 +49,19 @@ class StyleResolver:
         self._load_css(text, None)
 
     def _load_css(self, text: str, source: Path | None = None) -> None:
-        clean = COMMENT_RE.sub("", text)
-        for match in CSS_RULE_RE.finditer(clean):
-            selectors = [s.strip() for s in match.group("selectors").split(",") if s.strip()]
-            properties = self._parse_properties(match.group("body"))
-            for selector in selectors:
-                selector_type, selector_value = self._parse_selector(selector)
-                rule = CssRule(selector_type, selector_value, properties)
-                self.rules.append(rule)
+        self._css_cache.clear()
+        buckets = {"tag": self._by_tag, "class": self._by_class, "id": self._by_id}
+        for rule in _parse_css_cached(text):
+            entry = (len(self.rules), rule.properties)
+            self.rules.append(rule)
+            if rule.selector_type == "universal":
+                self._universal.append(entry)
+            else:
+                buckets[rule.selector_type].setdefault(rule.selector_value, []).append(entry)
 
     @staticmethod
     def _parse_properties(body: str) -> Dict[str, Any]:
-        props: Dict[str, Any] = {}
-        for declaration in body.split(";"):
-            if not declaration.strip():
-                continue
-            if ":" not in declaration:
-                continue
-            name, value = declaration.split(":", 1)
-            props[name.strip()] = value.strip()
-        return props
+        return {name.strip(): value.strip() for name, value in DECLARATION_RE.findall(body)}
 
     @staticmethod
     def _parse_selector(selector: str) -> Tuple[str, str]:
@@ -64,37 +74,52 @@ class StyleResolver:
         return "tag", selector.lower()
 
     def resolve(self, element: etree._Element, extra_style: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        style: Dict[str, Any] = {}
-        classes = set(self.extract_classes(element))
+        by_class = self._by_class
+        classes = frozenset(cls for cls in self.extract_classes(element) if cls in by_class)
         elem_id = element.get("id")
-        tag = etree.QName(element.tag).localname.lower()
-
-        for rule in self.rules:
-            if rule.selector_type == "universal":
-                style.update(rule.properties)
-            elif rule.selector_type == "tag" and rule.selector_value == tag:
-                style.update(rule.properties)
-            elif rule.selector_type == "class" and rule.selector_value in classes:
-                style.update(rule.properties)
-            elif rule.selector_type == "id" and elem_id and rule.selector_value == elem_id:
-                style.update(rule.properties)
+        if elem_id not in self._by_id:
+            elem_id = None  # ids without rules would only fragment the cache
+        tag = local_name(element.tag)
+        inline_style = element.get("style")
 
-        style.update(self._attributes_to_style(element))
+        if not classes and elem_id is None and not self._universal and tag not in self._by_tag:
+            # No stylesheet rule can apply; inline-attribute-only exports take this path.
+            style = self._attributes_to_style(element)
+        else:
+            key = (tag, classes, elem_id)
+            css_style = self._css_cache.get(key)
+            if css_style is None:
+                css_style = self._css_cache[key] = self._resolve_css(tag, classes, elem_id)
+            style = dict(css_style)
+            style.update(self._attributes_to_style(element))
 
-        inline_style = element.get("style")
         if inline_style:
-            style.update(parse_inline_style(inline_style))
+            style.update(_inline_declarations(inline_style))
 
         if extra_style:
             style.update(extra_style)
         return style
 
+    def _resolve_css(self, tag: str, classes: FrozenSet[str], elem_id: str | None) -> Dict[str, Any]:
+        matched = list(self._universal)
+        matched.extend(self._by_tag.get(tag, ()))
+        for cls in classes:
+            matched.extend(self._by_class[cls])
+        if elem_id:
+            matched.extend(self._by_id[elem_id])
+        # Later rules win, exactly as when every rule was scanned in document order.
+        matched.sort(key=_rule_position)
+        style: Dict[str, Any] = {}
+        for _, properties in matched:
+            style.update(properties)
+        return style
+
     @staticmethod
     def extract_classes(element: etree._Element) -> Tuple[str, ...]:
         value = element.get("class")
         if not value:
             return tuple()
-        return tuple(cls for cls in value.split(" ") if cls)
+        return _split_classes(value)
 
     @staticmethod
     def _attributes_to_style(element: etree._Element) -> Dict[str, Any]:
@@ -106,12 +131,36 @@ class StyleResolver:
 
 
 def parse_inline_style(style_value: str) -> Dict[str, Any]:
-    properties: Dict[str, Any] = {}
-    for part in style_value.split(";"):
-        if not part.strip():
-            continue
-        if ":" not in part:
-            continue
-        name, value = part.split(":", 1)
-        properties[name.strip()] = value.strip()
-    return properties
+    return dict(_inline_declarations(style_value))
+
+
+@lru_cache(maxsize=1024)
+def _split_classes(value: str) -> Tuple[str, ...]:
+    # Class tokens repeat across thousands of elements; interning makes rule lookups identity hits.
+    # Duplicates are dropped so merge_classes can pass either side through unchanged.
+    return tuple(dict.fromkeys(sys.intern(cls) for cls in value.split(" ") if cls))
+
+
+@lru_cache(maxsize=4096)
+def _inline_declarations(style_value: str) -> Tuple[Tuple[str, str], ...]:
+    # CAD exports repeat the same inline style on most elements; parse each distinct string once.
+    return tuple((name.strip(), value.strip()) for name, value in DECLARATION_RE.findall(style_value))
+
+
+def _rule_position(entry: Tuple[int, Dict[str, Any]]) -> int:
+    return entry[0]
+
+
+@lru_cache(maxsize=64)
+def _parse_css_cached(text: str) -> Tuple[CssRule, ...]:
+    # Exported SVGs repeat the same <style> block and CSS files across loads; parse each text once.
+    # The rules (and their property dicts) are shared, so they are treated as read-only.
+    rules: List[CssRule] = []
+    clean = COMMENT_RE.sub("", text)
+    for match in CSS_RULE_RE.finditer(clean):
+        selectors = [s.strip() for s in match.group("selectors").split(",") if s.strip()]
+        properties = StyleResolver._parse_properties(match.group("body"))
+        for selector in selectors:
+            selector_type, selector_value = StyleResolver._parse_selector(selector)
+            rules.append(CssRule(selector_type, selector_value, properties))
+    return tuple(rules)
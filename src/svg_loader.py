@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-from collections import deque
+import gzip
+import io
 import math
+import re
 from pathlib import Path
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
 from urllib.parse import unquote, urlparse
 
 import numpy as np
 from lxml import etree
 
-from .models import Point, SvgDocument, SvgPrimitive
-from .path_parser import path_to_polylines, simplify_polyline
-from .style_resolver import StyleResolver
+from .models import UNIT_CONVERSIONS, Point, SvgDocument, SvgPrimitive, parse_length
+from .path_parser import path_to_polylines, simplify_polyline_array
+from .style_resolver import StyleResolver, local_name
 from .transform_utils import (
-    apply_transform,
-    identity_matrix,
     multiply,
     parse_transform,
+    transform_array,
     transform_point,
     translation_matrix,
     scale_matrix,
@@ -24,14 +25,14 @@ from .transform_utils import (
 
 LengthUnit = Tuple[float, str]
 
-UNIT_CONVERSIONS = {
-    "mm": 1.0,
-    "cm": 10.0,
-    "in": 25.4,
-    "pt": 25.4 / 72.0,
-    "pc": 25.4 / 6.0,
-    "px": 25.4 / 96.0,
-}
+GROUP_TAGS = frozenset({"g", "svg", "a"})
+SKIP_TAGS = frozenset({"defs", "metadata"})
+# Leaf elements with a matching _create_<name> method; <image> is handled separately.
+CREATOR_NAMES = ("line", "polyline", "polygon", "rect", "circle", "ellipse", "path", "text")
+# Opening <style> / <svg:style> tag in raw bytes; comments or CDATA may give false positives.
+STYLE_TAG_RE = re.compile(rb"<(?:[\w.-]+:)?style[\s/>]", re.IGNORECASE)
+# Characters that make an <image> href more than a bare path (scheme, escapes, query, fragment, params).
+URL_SYNTAX_RE = re.compile(r"[:%?#;\t\r\n]")
 
 
 class SvgLoader:
@@ -39,29 +40,46 @@ class SvgLoader:
 
     def __init__(self, css_files: Iterable[Path] | None = None):
         self.css_files = list(css_files or [])
-
-    def load(self, path: Path) -> SvgDocument:
+        # Embedded SVGs loaded during the current load(), by absolute path; an icon referenced
+        # many times is parsed once. Reset per load() so edits between loads are picked up.
+        self._embedded_cache: Dict[Path, SvgDocument] = {}
+        # Identical computed styles are shared by every primitive of one load() that uses them.
+        self._style_intern: Dict[FrozenSet[Tuple[str, str]], Dict[str, str]] = {}
+        self._creators = {name: getattr(self, f"_create_{name}") for name in CREATOR_NAMES}
+
+    def load(self, path: Path, data: bytes | None = None) -> SvgDocument:
+        """Load ``path``; pass ``data`` when its bytes were already read (referenced files are still read from disk)."""
         visited: Set[Path] = set()
-        return self._load_internal(path, visited)
+        self._embedded_cache = {}
+        self._style_intern = {}
+        try:
+            return self._load_internal(path, visited, data)
+        finally:
+            self._embedded_cache = {}
+            self._style_intern = {}
 
-    def _load_internal(self, path: Path, visited: Set[Path]) -> SvgDocument:
+    def _load_internal(self, path: Path, visited: Set[Path], data: bytes | None = None) -> SvgDocument:
         absolute_path = path.resolve()
         if absolute_path in visited:
             raise RuntimeError(f"순환 참조가 감지되어 SVG를 불러올 수 없습니다: {absolute_path}")
         visited.add(absolute_path)
-
         try:
-            tree = etree.parse(str(absolute_path))
-        except OSError as exc:  # pragma: no cover - IO 오류 방지
+            if data is None:
+                data = read_svg_bytes(absolute_path)
+            return self._parse_document(absolute_path, data, visited)
+        finally:
             visited.remove(absolute_path)
-            raise exc
 
-        root = tree.getroot()
+    def _parse_document(self, absolute_path: Path, data: bytes, visited: Set[Path]) -> SvgDocument:
+        # Two streaming passes over the bytes instead of one full tree: the first only collects
+        # the root attributes and <style> text (CSS applies regardless of where it appears), the
+        # second builds primitives and frees each subtree once it has been converted.
+        root_attrib, css_texts = prescan_svg(data, absolute_path)
 
-        width_mm = parse_length(root.get("width", "0"))
-        height_mm = parse_length(root.get("height", "0"))
+        width_mm = parse_length(root_attrib.get("width", "0"))
+        height_mm = parse_length(root_attrib.get("height", "0"))
 
-        viewbox = parse_viewbox(root.get("viewBox"))
+        viewbox = parse_viewbox(root_attrib.get("viewBox"))
         if viewbox is None:
             viewbox = (0.0, 0.0, width_mm or 1.0, height_mm or 1.0)
 
@@ -70,9 +88,8 @@ class SvgLoader:
         scale_y = height_mm / viewbox_height if viewbox_height else 1.0
 
         style_resolver = StyleResolver(self.css_files)
-        for node in root.iter():
-            if etree.QName(node.tag).localname.lower() == "style" and node.text:
-                style_resolver.add_css_text(node.text)
+        for text in css_texts:
+            style_resolver.add_css_text(text)
 
         root_matrix = np.array(
             [
@@ -95,66 +112,101 @@ class SvgLoader:
             warnings=[],
         )
 
-        stack = deque([(root, root_matrix, {}, tuple())])
-        while stack:
-            element, transform, inherited_style, inherited_classes = stack.pop()
-            local_name = etree.QName(element.tag).localname.lower()
-
-            if local_name in {"defs", "metadata"}:
-                continue
-
-            element_transform = parse_transform(element.get("transform"))
-            current_transform = multiply(transform, element_transform)
+        # (transform, style, classes) of every open g/svg/a container.
+        contexts: List[Tuple[np.ndarray, Dict[str, str], Tuple[str, ...]]] = [(root_matrix, {}, tuple())]
+        # Depth inside a leaf or defs/metadata subtree; those children are not visited on their own.
+        ignore_depth = 0
+        leaf: etree._Element | None = None
 
-            element_style = style_resolver.resolve(element)
-            combined_style = dict(inherited_style)
-            combined_style.update(element_style)
-
-            element_classes = style_resolver.extract_classes(element)
-            combined_classes = merge_classes(inherited_classes, element_classes)
-
-            if local_name in {"g", "svg", "a"}:
-                for child in reversed(list(element)):
-                    stack.append((child, current_transform, combined_style, combined_classes))
+        for event, element in etree.iterparse(svg_source(data, absolute_path), events=("start", "end"), huge_tree=True):
+            if event == "start":
+                if ignore_depth:
+                    ignore_depth += 1
+                    continue
+                tag = local_name(element.tag)
+                if tag in SKIP_TAGS:
+                    ignore_depth = 1
+                    leaf = None
+                elif tag in GROUP_TAGS:
+                    contexts.append(self._element_context(element, contexts[-1], style_resolver))
+                else:
+                    # Leaves are converted on their end event, when children such as <tspan> are parsed.
+                    ignore_depth = 1
+                    leaf = element
                 continue
 
-            if local_name == "image":
-                primitives, warnings = self._create_image(
-                    element=element,
-                    transform=current_transform,
-                    classes=combined_classes,
-                    document=document,
-                    visited=visited,
-                )
-            else:
-                primitive_creators = {
-                    "line": self._create_line,
-                    "polyline": self._create_polyline,
-                    "polygon": self._create_polygon,
-                    "rect": self._create_rect,
-                    "circle": self._create_circle,
-                    "ellipse": self._create_ellipse,
-                    "path": self._create_path,
-                    "text": self._create_text,
-                }
-
-                creator = primitive_creators.get(local_name)
-                if not creator:
+            if ignore_depth:
+                ignore_depth -= 1
+                if ignore_depth:
                     continue
+                if leaf is element:
+                    self._convert_leaf(element, contexts[-1], style_resolver, document, visited)
+                    leaf = None
+            else:
+                contexts.pop()
+            release_element(element)
 
-                primitives, warnings = creator(
-                    element=element,
-                    transform=current_transform,
-                    style=combined_style,
-                    classes=combined_classes,
-                )
-            if primitives:
-                document.primitives.extend(primitives)
-            document.warnings.extend(warnings)
-
-        visited.remove(absolute_path)
         return document
 
+    @staticmethod
+    def _element_context(
+        element: etree._Element,
+        parent: Tuple[np.ndarray, Dict[str, str], Tuple[str, ...]],
+        style_resolver: StyleResolver,
+    ) -> Tuple[np.ndarray, Dict[str, str], Tuple[str, ...]]:
+        transform, inherited_style, inherited_classes = parent
+        element_transform = parse_transform(element.get("transform"))
+        current_transform = multiply(transform, element_transform)
+
+        element_style = style_resolver.resolve(element)
+        combined_style = dict(inherited_style)
+        combined_style.update(element_style)
+
+        element_classes = style_resolver.extract_classes(element)
+        combined_classes = merge_classes(inherited_classes, element_classes)
+        return current_transform, combined_style, combined_classes
+
+    def _convert_leaf(
+        self,
+        element: etree._Element,
+        parent: Tuple[np.ndarray, Dict[str, str], Tuple[str, ...]],
+        style_resolver: StyleResolver,
+        document: SvgDocument,
+        visited: Set[Path],
+    ) -> None:
+        tag = local_name(element.tag)
+        current_transform, combined_style, combined_classes = self._element_context(element, parent, style_resolver)
+
+        if tag == "image":
+            primitives, warnings = self._create_image(
+                element=element,
+                transform=current_transform,
+                classes=combined_classes,
+                document=document,
+                visited=visited,
+            )
+        else:
+            creator = self._creators.get(tag)
+            if not creator:
+                return
+
+            primitives, warnings = creator(
+                element=element,
+                transform=current_transform,
+                style=self._shared_style(combined_style),
+                classes=combined_classes,
+            )
+        if primitives:
+            document.add_primitives(primitives)
+        document.warnings.extend(warnings)
+
+    def _shared_style(self, style: Dict[str, str]) -> Dict[str, str]:
+        key = frozenset(style.items())
+        shared = self._style_intern.get(key)
+        if shared is None:
+            shared = self._style_intern[key] = style
+        return shared
+
     def _create_line(
         self,
         *,
@@ -171,14 +223,14 @@ class SvgLoader:
         except ValueError:
             return [], [f"경고: line 좌표 파싱 실패 (id={element.get('id')})"]
 
-        points = apply_transform(transform, [(x1, y1), (x2, y2)])
+        points = transform_array(transform, [(x1, y1), (x2, y2)])
         primitive = SvgPrimitive(
             kind="line",
             points=points,
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
         )
         return [primitive], []
 
@@ -202,12 +254,15 @@ class SvgLoader:
         if href.startswith("data:"):
             return [], []
 
-        decoded = unquote(href)
-        parsed = urlparse(decoded)
-        if parsed.scheme and parsed.scheme != "file":
-            return [], []
-
-        path_str = parsed.path or decoded
+        if href.startswith("//") or URL_SYNTAX_RE.search(href):
+            decoded = unquote(href)
+            parsed = urlparse(decoded)
+            if parsed.scheme and parsed.scheme != "file":
+                return [], []
+            path_str = parsed.path or decoded
+        else:
+            # Plain relative/absolute file path: nothing for unquote/urlparse to change.
+            path_str = href
         if ".svg" not in path_str.lower():
             return [], []
 
@@ -215,10 +270,14 @@ class SvgLoader:
         if not candidate.exists():
             return [], [f"경고: 참조한 SVG 파일을 찾을 수 없습니다 ({href})"]
 
-        try:
-            embedded_document = self._load_internal(candidate, visited)
-        except RuntimeError as exc:
-            return [], [f"경고: SVG 이미지 참조를 불러오지 못했습니다 ({candidate}): {exc}"]
+        cache_key = candidate.resolve()
+        embedded_document = self._embedded_cache.get(cache_key)
+        if embedded_document is None:
+            try:
+                embedded_document = self._load_internal(candidate, visited)
+            except RuntimeError as exc:
+                return [], [f"경고: SVG 이미지 참조를 불러오지 못했습니다 ({candidate}): {exc}"]
+            self._embedded_cache[cache_key] = embedded_document
 
         width_attr = parse_length(element.get("width"))
         height_attr = parse_length(element.get("height"))
@@ -241,17 +300,17 @@ class SvgLoader:
 
         primitives: List[SvgPrimitive] = []
         for prim in embedded_document.primitives:
-            transformed_points = apply_transform(combined_transform, prim.points)
+            transformed_points = transform_array(combined_transform, prim.points)
             extra = prim.extra.copy() if isinstance(prim.extra, dict) else prim.extra
             merged_classes = merge_classes(classes, prim.classes)
             primitives.append(
                 SvgPrimitive(
                     kind=prim.kind,
                     points=transformed_points,
-                    style=dict(prim.style),
+                    style=prim.style,
                     classes=merged_classes,
                     element_id=prim.element_id,
-                    attributes=dict(prim.attributes),
+                    attributes=prim.attributes,
                     extra=extra,
                 )
             )
@@ -269,17 +328,16 @@ class SvgLoader:
         classes: Tuple[str, ...],
     ) -> Tuple[List[SvgPrimitive], List[str]]:
         points = parse_points_attribute(element.get("points", ""))
-        if not points:
+        if not len(points):
             return [], []
-        transformed = apply_transform(transform, points)
-        simplified = simplify_polyline(transformed, closed=False)
+        simplified = simplify_polyline_array(transform_array(transform, points), closed=False)
         primitive = SvgPrimitive(
             kind="polyline",
             points=simplified,
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
             extra={"closed": False, "origin": "polyline"},
         )
         return [primitive], []
@@ -293,19 +351,18 @@ class SvgLoader:
         classes: Tuple[str, ...],
     ) -> Tuple[List[SvgPrimitive], List[str]]:
         points = parse_points_attribute(element.get("points", ""))
-        if not points:
+        if not len(points):
             return [], []
-        if points[0] != points[-1]:
-            points.append(points[0])
-        transformed = apply_transform(transform, points)
-        simplified = simplify_polyline(transformed, closed=True)
+        if not np.array_equal(points[0], points[-1]):
+            points = np.vstack((points, points[:1]))
+        simplified = simplify_polyline_array(transform_array(transform, points), closed=True)
         primitive = SvgPrimitive(
             kind="polyline",
             points=simplified,
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
             extra={"closed": True, "origin": "polygon"},
         )
         return [primitive], []
@@ -333,14 +390,14 @@ class SvgLoader:
             (x, y + height),
             (x, y),
         ]
-        transformed = apply_transform(transform, points)
+        transformed = transform_array(transform, points)
         primitive = SvgPrimitive(
             kind="polyline",
             points=transformed,
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
             extra={
                 "closed": True,
                 "origin": "rect",
@@ -366,17 +423,14 @@ class SvgLoader:
             return [], [f"경고: circle 치수 파싱 실패 (id={element.get('id')})"]
 
         center = transform_point(transform, (cx, cy))
-        point_x = transform_point(transform, (cx + radius, cy))
-        point_y = transform_point(transform, (cx, cy + radius))
-        radius_x = distance(center, point_x)
-        radius_y = distance(center, point_y)
+        radius_x, radius_y = transformed_radii(transform, center, cx, cy, radius, radius)
         primitive = SvgPrimitive(
             kind="circle",
             points=[center],
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
             extra={"radius_x": radius_x, "radius_y": radius_y},
         )
         return [primitive], []
@@ -398,18 +452,15 @@ class SvgLoader:
             return [], [f"경고: ellipse 치수 파싱 실패 (id={element.get('id')})"]
 
         center = transform_point(transform, (cx, cy))
-        point_x = transform_point(transform, (cx + rx, cy))
-        point_y = transform_point(transform, (cx, cy + ry))
-        radius_x = distance(center, point_x)
-        radius_y = distance(center, point_y)
+        radius_x, radius_y = transformed_radii(transform, center, cx, cy, rx, ry)
 
         primitive = SvgPrimitive(
             kind="ellipse",
             points=[center],
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
             extra={"radius_x": radius_x, "radius_y": radius_y},
         )
         return [primitive], []
@@ -428,16 +479,17 @@ class SvgLoader:
 
         polylines, warnings = path_to_polylines(data)
         primitives: List[SvgPrimitive] = []
+        # Subpaths of one element share its (read-only) attribute dict.
+        attributes = dict(element.items())
         for poly in polylines:
-            transformed = apply_transform(transform, poly.points)
-            simplified = simplify_polyline(transformed, closed=poly.closed)
+            simplified = simplify_polyline_array(transform_array(transform, poly.points), closed=poly.closed)
             primitive = SvgPrimitive(
                 kind="polyline",
                 points=simplified,
-                style=dict(style),
+                style=style,
                 classes=classes,
                 element_id=element.get("id"),
-                attributes=dict(element.attrib),
+                attributes=attributes,
                 extra={"closed": poly.closed, "origin": "path"},
             )
             primitives.append(primitive)
@@ -467,10 +519,10 @@ class SvgLoader:
         primitive = SvgPrimitive(
             kind="text",
             points=[position],
-            style=dict(style),
+            style=style,
             classes=classes,
             element_id=element.get("id"),
-            attributes=dict(element.attrib),
+            attributes=dict(element.items()),
             extra={
                 "text": text_content,
                 "text_anchor": element.get("text-anchor", style.get("text-anchor")),
@@ -483,15 +535,14 @@ class SvgLoader:
 
 
 def extract_text_content(element: etree._Element) -> str:
-    tspans = [node for node in element if etree.QName(node.tag).localname.lower() == "tspan"]
-    if tspans:
-        lines = []
-        for tspan in tspans:
-            text = "".join(tspan.itertext()).strip()
-            if text:
-                lines.append(text)
-        if lines:
-            return "\n".join(lines)
+    # "{*}tspan" lets lxml match tspan children in any (or no) namespace without per-child QName work.
+    lines = []
+    for tspan in element.iterchildren("{*}tspan"):
+        text = "".join(tspan.itertext()).strip()
+        if text:
+            lines.append(text)
+    if lines:
+        return "\n".join(lines)
     combined = " ".join("".join(element.itertext()).split())
     return combined
 
@@ -524,24 +575,6 @@ def extract_font_family(element: etree._Element, style: Dict[str, str]) -> str |
     return families[0] if families else None
 
 
-def parse_length(value: str | None) -> float:
-    if not value:
-        return 0.0
-    value = value.strip()
-    unit = "".join(ch for ch in value if ch.isalpha())
-    number = value.rstrip("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
-    try:
-        magnitude = float(number)
-    except ValueError:
-        return 0.0
-    if not unit:
-        return magnitude
-    factor = UNIT_CONVERSIONS.get(unit.lower())
-    if not factor:
-        return magnitude
-    return magnitude * factor
-
-
 def parse_viewbox(value: str | None) -> Tuple[float, float, float, float] | None:
     if not value:
         return None
@@ -555,12 +588,17 @@ def parse_viewbox(value: str | None) -> Tuple[float, float, float, float] | None
     return numbers  # type: ignore[return-value]
 
 
-def parse_points_attribute(value: str) -> List[Point]:
-    points: List[Point] = []
-    cleaned = value.replace(",", " ")
-    parts = [p for p in cleaned.strip().split() if p]
+def parse_points_attribute(value: str) -> np.ndarray:
+    """Parse a ``points`` attribute into an (N, 2) array; an odd trailing number is dropped."""
+    parts = value.replace(",", " ").split()
     if len(parts) % 2 != 0:
         parts = parts[:-1]
+    try:
+        # One C-level conversion for the whole list; only malformed input takes the pairwise path.
+        return np.array(parts, dtype=np.float64).reshape(-1, 2)
+    except ValueError:
+        pass
+    points: List[Point] = []
     for i in range(0, len(parts), 2):
         try:
             x = float(parts[i])
@@ -568,16 +606,83 @@ def parse_points_attribute(value: str) -> List[Point]:
         except ValueError:
             continue
         points.append((x, y))
-    return points
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
+
+
+def read_svg_bytes(path: Path) -> bytes:
+    """Read an SVG file once for both parsing passes; gzip-compressed (svgz) files are inflated."""
+    data = path.read_bytes()
+    if data.startswith(b"\x1f\x8b"):
+        data = gzip.decompress(data)
+    return data
+
+
+def svg_source(data: bytes, path: Path) -> io.BytesIO:
+    """In-memory parser input that still reports ``path`` in lxml syntax errors."""
+    source = io.BytesIO(data)
+    source.name = str(path)
+    return source
+
+
+def prescan_svg(data: bytes, path: Path) -> Tuple[Dict[str, str], List[str]]:
+    """Stream the document once for the root attributes and every <style> text, in document order."""
+    root_attrib: Dict[str, str] | None = None
+    css_texts: List[str] = []
+    scan_styles = may_contain_style(data)
+    for event, element in etree.iterparse(svg_source(data, path), events=("start", "end"), huge_tree=True):
+        if event == "start":
+            if root_attrib is None:
+                root_attrib = dict(element.attrib)
+                if not scan_styles:
+                    # Without any <style> only the root is needed; skip parsing the rest twice.
+                    break
+            continue
+        if local_name(element.tag) == "style" and element.text:
+            css_texts.append(element.text)
+        release_element(element)
+    return root_attrib or {}, css_texts
+
+
+def may_contain_style(data: bytes) -> bool:
+    """Cheap byte scan for a <style> tag; answers True whenever the bytes cannot be trusted."""
+    head = data[:4]
+    # UTF-16/32 documents are not searchable as plain bytes.
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")) or b"\x00" in head:
+        return True
+    return STYLE_TAG_RE.search(data) is not None
+
+
+def release_element(element: etree._Element) -> None:
+    """Free a finished element and the already-processed siblings before it."""
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
 
 
 def merge_classes(inherited: Tuple[str, ...], current: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Both sides are already duplicate-free, so an empty side leaves the other as the result;
+    # most elements add no classes to their group's.
+    if not current:
+        return inherited
+    if not inherited:
+        return current
     merged: Dict[str, None] = dict.fromkeys(inherited)
     for cls in current:
         merged.setdefault(cls, None)
     return tuple(merged.keys())
 
 
+def transformed_radii(transform: np.ndarray, center: Point, cx: float, cy: float, rx: float, ry: float) -> Tuple[float, float]:
+    if transform[0, 1] == 0.0 and transform[1, 0] == 0.0:
+        # Axis-aligned transforms (the usual case) scale each radius by its diagonal entry.
+        return abs(float(transform[0, 0]) * rx), abs(float(transform[1, 1]) * ry)
+    radius_x = distance(center, transform_point(transform, (cx + rx, cy)))
+    radius_y = distance(center, transform_point(transform, (cx, cy + ry)))
+    return radius_x, radius_y
+
+
 def distance(p1: Point, p2: Point) -> float:
     return float(((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2) ** 0.5)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import re
+from functools import lru_cache
 from typing import Iterable, List, Tuple
 
 import numpy as np
@@ -9,13 +10,24 @@ import numpy as np
 from .models import Point
 
 TRANSFORM_RE = re.compile(r"(?P<name>[a-zA-Z]+)\((?P<args>[^)]+)\)")
+# One SVG number; also splits compact argument lists such as "10-20" or ".5.5".
+NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Shared, read-only identity returned for elements without a transform attribute.
+IDENTITY = np.identity(3)
+IDENTITY.setflags(write=False)
 
 
 def identity_matrix() -> np.ndarray:
-    return np.identity(3)
+    # Matrices are never modified in place, so every caller can share the read-only constant.
+    return IDENTITY
 
 
 def multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if b is IDENTITY:
+        return a
+    if a is IDENTITY:
+        return b
     return a @ b
 
 
@@ -27,59 +39,96 @@ def scale_matrix(sx: float, sy: float) -> np.ndarray:
     return np.array([[sx, 0.0, 0.0], [0.0, sy, 0.0], [0.0, 0.0, 1.0]], dtype=float)
 
 
+# An affine (a, b, c, d, e, f) standing for [[a, c, e], [b, d, f], [0, 0, 1]], as in SVG's matrix().
+Affine = Tuple[float, float, float, float, float, float]
+IDENTITY_AFFINE: Affine = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+@lru_cache(maxsize=4096)
 def parse_transform(transform: str | None) -> np.ndarray:
+    """Parse a ``transform`` attribute; results are cached per string and returned read-only."""
     if not transform:
-        return identity_matrix()
+        return IDENTITY
     transform = transform.strip()
-    matrix = identity_matrix()
+    # Compose on six floats and build the ndarray once, instead of a 3x3 array and matmul per command.
+    affine = IDENTITY_AFFINE
     for match in TRANSFORM_RE.finditer(transform):
         name = match.group("name").lower()
-        args = [float(x) for x in re.split(r"[ ,]+", match.group("args").strip()) if x]
-        matrix = multiply(matrix, _matrix_for_command(name, args))
+        args = list(map(float, NUMBER_RE.findall(match.group("args"))))
+        command = _affine_for_command(name, args)
+        if command is not None:
+            affine = compose_affine(affine, command)
+    if affine == IDENTITY_AFFINE:
+        return IDENTITY
+    a, b, c, d, e, f = affine
+    matrix = np.array([[a, c, e], [b, d, f], [0.0, 0.0, 1.0]], dtype=float)
+    matrix.setflags(write=False)
     return matrix
 
 
-def _matrix_for_command(name: str, args: List[float]) -> np.ndarray:
+def compose_affine(m: Affine, n: Affine) -> Affine:
+    """Return ``m @ n`` for two affines in (a, b, c, d, e, f) form."""
+    a1, b1, c1, d1, e1, f1 = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * e2 + c1 * f2 + e1,
+        b1 * e2 + d1 * f2 + f1,
+    )
+
+
+def _affine_for_command(name: str, args: List[float]) -> Affine | None:
     if name == "matrix" and len(args) == 6:
         a, b, c, d, e, f = args
-        return np.array([[a, c, e], [b, d, f], [0, 0, 1]], dtype=float)
+        return a, b, c, d, e, f
     if name == "translate":
         tx = args[0]
         ty = args[1] if len(args) > 1 else 0.0
-        return np.array([[1, 0, tx], [0, 1, ty], [0, 0, 1]], dtype=float)
+        return 1.0, 0.0, 0.0, 1.0, tx, ty
     if name == "scale":
         sx = args[0]
         sy = args[1] if len(args) > 1 else sx
-        return np.array([[sx, 0, 0], [0, sy, 0], [0, 0, 1]], dtype=float)
+        return sx, 0.0, 0.0, sy, 0.0, 0.0
     if name == "rotate":
         angle = math.radians(args[0])
         cos_a = math.cos(angle)
         sin_a = math.sin(angle)
         if len(args) == 3:
+            # translate(cx, cy) rotate(angle) translate(-cx, -cy)
             cx, cy = args[1], args[2]
-            translate_to_origin = np.array([[1, 0, -cx], [0, 1, -cy], [0, 0, 1]], dtype=float)
-            rotation = np.array([[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]], dtype=float)
-            translate_back = np.array([[1, 0, cx], [0, 1, cy], [0, 0, 1]], dtype=float)
-            return translate_back @ rotation @ translate_to_origin
-        return np.array([[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]], dtype=float)
+            return cos_a, sin_a, -sin_a, cos_a, cx - cos_a * cx + sin_a * cy, cy - sin_a * cx - cos_a * cy
+        return cos_a, sin_a, -sin_a, cos_a, 0.0, 0.0
     if name == "skewx":
         angle = math.radians(args[0])
-        return np.array([[1, math.tan(angle), 0], [0, 1, 0], [0, 0, 1]], dtype=float)
+        return 1.0, 0.0, math.tan(angle), 1.0, 0.0, 0.0
     if name == "skewy":
         angle = math.radians(args[0])
-        return np.array([[1, 0, 0], [math.tan(angle), 1, 0], [0, 0, 1]], dtype=float)
-    return identity_matrix()
+        return 1.0, math.tan(angle), 0.0, 1.0, 0.0, 0.0
+    return None
 
 
 def apply_transform(matrix: np.ndarray, points: Iterable[Point]) -> List[Point]:
-    result: List[Point] = []
-    for x, y in points:
-        vec = np.array([x, y, 1.0])
-        res = matrix @ vec
-        result.append((float(res[0]), float(res[1])))
-    return result
+    transformed = transform_array(matrix, points)
+    return list(zip(transformed[:, 0].tolist(), transformed[:, 1].tolist()))
+
+
+def transform_array(matrix: np.ndarray, points: Iterable[Point]) -> np.ndarray:
+    # One affine pass over an (N, 2) block instead of a 3-vector matmul per point.
+    coords = np.asarray(points if isinstance(points, (np.ndarray, list, tuple)) else list(points), dtype=np.float64)
+    if coords.size == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    coords = coords.reshape(-1, 2)
+    transformed = coords @ matrix[:2, :2].T
+    # Add the translation in place so large point blocks allocate a single output array.
+    transformed += matrix[:2, 2]
+    return transformed
 
 
 def transform_point(matrix: np.ndarray, point: Point) -> Point:
-    (x, y) = apply_transform(matrix, [point])[0]
-    return x, y
+    # Scalar form for the single-point case; no array round trip.
+    (x, y) = point
+    (a, b, c), (d, e, f) = matrix[:2].tolist()
+    return a * x + b * y + c, d * x + e * y + f
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import weakref
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -14,27 +18,50 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QPlainTextEdit,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
-from ..mapping import MappingManager
-from ..models import MappingRule, SvgDocument
+from ..mapping import MappingManager, sanitize_style_name
+from ..models import ConversionResult, MappingRule, SvgDocument, SvgDocumentSummary
 from ..pipeline import PipelineController
+from .table_model import MappingTableModel
 
+# Summaries of recently loaded files kept for re-loading an unchanged file; the documents
+# themselves are only held weakly (plus the current and previous one).
+DOCUMENT_CACHE_SIZE = 8
 
-def sanitize_style_name(name: str) -> str:
-    sanitized = []
-    for ch in name.strip():
-        if ch.isalnum() or ch in "-_":
-            sanitized.append(ch)
-        elif ch == " ":
-            sanitized.append("_")
-    value = "".join(sanitized)
-    return value[:31] if value else "STANDARD"
+# Conversion logs are appended this many lines at a time, and the log view keeps at most LOG_MAX_LINES.
+LOG_CHUNK_LINES = 256
+LOG_MAX_LINES = 20000
+
+DocumentKey = Tuple[str, int, int]
+# (id of the converted document, mapping table revisions or None if never edited, output path)
+ConvertKey = Tuple[int, Tuple[int, ...] | None, str]
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _Task(QRunnable):
+    """Run a load/convert call on the thread pool and report back through queued signals."""
+
+    def __init__(self, function: Callable[[], Any]):
+        super().__init__()
+        self.function = function
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.function()
+        except Exception as exc:  # reported to the user instead of killing the worker thread
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(result)
 
 
 class MainWindow(QMainWindow):
@@ -45,9 +72,27 @@ class MainWindow(QMainWindow):
 
         self.controller = PipelineController()
         self.current_document: SvgDocument | None = None
+        # (resolved path, mtime_ns, size) -> loaded document and its rendered summary; only the
+        # top-level file is checked, so edits to referenced SVG/CSS files alone need the file to be
+        # touched or re-saved. Documents nothing else keeps alive are left to the garbage collector.
+        self._documents: weakref.WeakValueDictionary[DocumentKey, SvgDocument] = weakref.WeakValueDictionary()
+        self._summary_cache: OrderedDict[DocumentKey, str] = OrderedDict()
+        # Kept alive so switching back and forth between two files stays a cache hit.
+        self._previous_document: SvgDocument | None = None
+        self._active_task: _Task | None = None
+        # Rules built from the rules model at a given model revision.
+        self._rules_cache: Tuple[int, List[MappingRule]] | None = None
+        # Last conversion with the DXF bytes it wrote and the file's (size, mtime_ns) afterwards;
+        # cleared whenever another document is shown.
+        self._convert_cache: Tuple[ConvertKey, ConversionResult, bytes, Tuple[int, int]] | None = None
+        # File dialogs are created on first use and kept, so they reopen in the last folder.
+        self._open_dialog: QFileDialog | None = None
+        self._save_dialog: QFileDialog | None = None
+        # Stripped line-edit paths, refreshed on textChanged; None while the field is blank.
+        self._input_path: Path | None = None
+        self._output_path: Path | None = None
 
         self._init_ui()
-        self._populate_default_rules()
 
     def _init_ui(self) -> None:
         container = QWidget()
@@ -58,7 +103,27 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.tabs)
 
         self._init_convert_tab()
-        self._init_mapping_tab()
+        # The mapping tab is built (and its tables filled) the first time it is opened.
+        self._mapping_initialized = False
+        self._mapping_placeholder = QWidget()
+        self.tabs.addTab(self._mapping_placeholder, "레이어 매핑")
+        self.tabs.currentChanged.connect(self._ensure_mapping_tab)
+
+    def _ensure_mapping_tab(self, index: int) -> None:
+        if self._mapping_initialized or self.tabs.widget(index) is not self._mapping_placeholder:
+            return
+        self._mapping_initialized = True
+        tab = self._init_mapping_tab()
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, "레이어 매핑")
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        self._mapping_placeholder.deleteLater()
+        self._set_busy(self._active_task is not None)
+        self._populate_default_rules()
 
     def _init_convert_tab(self) -> None:
         tab = QWidget()
@@ -69,6 +134,7 @@ class MainWindow(QMainWindow):
         input_layout = QHBoxLayout()
         self.input_path_edit = QLineEdit()
         self.input_path_edit.setPlaceholderText("SVG 파일 경로")
+        self.input_path_edit.textChanged.connect(self._on_input_path_changed)
         browse_input_btn = QPushButton("찾기…")
         browse_input_btn.clicked.connect(self._browse_input)
         input_layout.addWidget(QLabel("SVG 파일:"))
@@ -80,6 +146,7 @@ class MainWindow(QMainWindow):
         output_layout = QHBoxLayout()
         self.output_path_edit = QLineEdit()
         self.output_path_edit.setPlaceholderText("DXF 출력 경로")
+        self.output_path_edit.textChanged.connect(self._on_output_path_changed)
         browse_output_btn = QPushButton("찾기…")
         browse_output_btn.clicked.connect(self._browse_output)
         output_layout.addWidget(QLabel("DXF 파일:"))
@@ -89,17 +156,18 @@ class MainWindow(QMainWindow):
 
         # Actions
         button_layout = QHBoxLayout()
-        load_btn = QPushButton("SVG 로드")
-        load_btn.clicked.connect(self._load_svg)
-        convert_btn = QPushButton("DXF 변환")
-        convert_btn.clicked.connect(self._convert_to_dxf)
-        button_layout.addWidget(load_btn)
-        button_layout.addWidget(convert_btn)
+        self.load_btn = QPushButton("SVG 로드")
+        self.load_btn.clicked.connect(self._load_svg)
+        self.convert_btn = QPushButton("DXF 변환")
+        self.convert_btn.clicked.connect(self._convert_to_dxf)
+        button_layout.addWidget(self.load_btn)
+        button_layout.addWidget(self.convert_btn)
         button_layout.addStretch()
         tab_layout.addLayout(button_layout)
 
         # Summary
         self.summary_label = QLabel("SVG 파일을 로드하면 요약이 표시됩니다.")
+        self.summary_label.setTextFormat(Qt.PlainText)
         self.summary_label.setWordWrap(True)
         self.summary_label.setFrameStyle(QLabel.Panel | QLabel.Sunken)
         self.summary_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
@@ -110,19 +178,21 @@ class MainWindow(QMainWindow):
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_output.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_output.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         tab_layout.addWidget(QLabel("변환 로그:"))
         tab_layout.addWidget(self.log_output, stretch=1)
 
         self.tabs.addTab(tab, "변환")
 
-    def _init_mapping_tab(self) -> None:
+    def _init_mapping_tab(self) -> QWidget:
         tab = QWidget()
         tab_layout = QVBoxLayout(tab)
         tab_layout.setContentsMargins(12, 12, 12, 12)
 
-        self.rules_table = QTableWidget(0, 5)
-        self.rules_table.setHorizontalHeaderLabels(["Selector", "Layer", "Color", "Linetype", "Lineweight (mm)"])
+        self.rules_model = MappingTableModel(["Selector", "Layer", "Color", "Linetype", "Lineweight (mm)"])
+        self.rules_table = QTableView()
+        self.rules_table.setModel(self.rules_model)
         self.rules_table.horizontalHeader().setStretchLastSection(True)
         tab_layout.addWidget(QLabel("레이어/스타일 매핑 규칙"))
         tab_layout.addWidget(self.rules_table)
@@ -132,11 +202,11 @@ class MainWindow(QMainWindow):
         add_btn.clicked.connect(self._add_rule)
         remove_btn = QPushButton("선택 삭제")
         remove_btn.clicked.connect(self._remove_rule)
-        reset_btn = QPushButton("기본값 복원")
-        reset_btn.clicked.connect(self._reset_rules)
+        self.reset_rules_btn = QPushButton("기본값 복원")
+        self.reset_rules_btn.clicked.connect(self._reset_rules)
         button_layout.addWidget(add_btn)
         button_layout.addWidget(remove_btn)
-        button_layout.addWidget(reset_btn)
+        button_layout.addWidget(self.reset_rules_btn)
         button_layout.addStretch()
         tab_layout.addLayout(button_layout)
 
@@ -144,13 +214,15 @@ class MainWindow(QMainWindow):
             "Selector 예시: 'class:IfcWall*', 'tag:polyline', 'attr:ifc:guid=*', 'style:stroke=#ff0000', 'any'\n"
             "Lineweight는 mm 단위 숫자이며 비워두면 스타일에서 자동으로 추정합니다."
         )
+        helper.setTextFormat(Qt.PlainText)
         helper.setWordWrap(True)
         tab_layout.addWidget(helper)
 
         tab_layout.addSpacing(16)
         tab_layout.addWidget(QLabel("재료 레이어 매핑 (.material-* 클래스)"))
-        self.material_table = QTableWidget(0, 5)
-        self.material_table.setHorizontalHeaderLabels(["Material Class", "Layer", "Color", "Linetype", "Lineweight (mm)"])
+        self.material_model = MappingTableModel(["Material Class", "Layer", "Color", "Linetype", "Lineweight (mm)"])
+        self.material_table = QTableView()
+        self.material_table.setModel(self.material_model)
         self.material_table.horizontalHeader().setStretchLastSection(True)
         tab_layout.addWidget(self.material_table)
 
@@ -165,13 +237,15 @@ class MainWindow(QMainWindow):
         tab_layout.addLayout(material_btn_layout)
 
         material_helper = QLabel("예: material-concrete → A-CONC, 색상은 #RRGGBB, BYLAYER, 또는 ACI 색상 번호(예: 1) 입력")
+        material_helper.setTextFormat(Qt.PlainText)
         material_helper.setWordWrap(True)
         tab_layout.addWidget(material_helper)
 
         tab_layout.addSpacing(16)
         tab_layout.addWidget(QLabel("패턴 매핑 (fill: url(#pattern))"))
-        self.pattern_table = QTableWidget(0, 6)
-        self.pattern_table.setHorizontalHeaderLabels(["Pattern ID", "DXF Pattern", "Scale", "Angle", "Color", "Solid"])
+        self.pattern_model = MappingTableModel(["Pattern ID", "DXF Pattern", "Scale", "Angle", "Color", "Solid"])
+        self.pattern_table = QTableView()
+        self.pattern_table.setModel(self.pattern_model)
         self.pattern_table.horizontalHeader().setStretchLastSection(True)
         tab_layout.addWidget(self.pattern_table)
 
@@ -186,13 +260,15 @@ class MainWindow(QMainWindow):
         tab_layout.addLayout(pattern_btn_layout)
 
         pattern_helper = QLabel("패턴 ID는 SVG의 <pattern id> 값입니다. Solid 는 'Y' 또는 'N'.")
+        pattern_helper.setTextFormat(Qt.PlainText)
         pattern_helper.setWordWrap(True)
         tab_layout.addWidget(pattern_helper)
 
         tab_layout.addSpacing(16)
         tab_layout.addWidget(QLabel("폰트 매핑 (font-family)"))
-        self.font_table = QTableWidget(0, 3)
-        self.font_table.setHorizontalHeaderLabels(["Font Family", "DXF Text Style", "Font File"])
+        self.font_model = MappingTableModel(["Font Family", "DXF Text Style", "Font File"])
+        self.font_table = QTableView()
+        self.font_table.setModel(self.font_model)
         self.font_table.horizontalHeader().setStretchLastSection(True)
         tab_layout.addWidget(self.font_table)
 
@@ -207,6 +283,7 @@ class MainWindow(QMainWindow):
         tab_layout.addLayout(font_btn_layout)
 
         font_helper = QLabel("SVG font-family 값과 사용할 DXF Text Style/폰트 파일을 매핑하세요.")
+        font_helper.setTextFormat(Qt.PlainText)
         font_helper.setWordWrap(True)
         tab_layout.addWidget(font_helper)
 
@@ -214,130 +291,246 @@ class MainWindow(QMainWindow):
         self.save_mapping_btn.clicked.connect(self._save_mapping_config)
         tab_layout.addWidget(self.save_mapping_btn, alignment=Qt.AlignRight)
 
-        self.tabs.addTab(tab, "레이어 매핑")
+        return tab
 
     def _populate_default_rules(self) -> None:
-        self.rules_table.setRowCount(0)
-        for rule in self.controller.default_rules():
-            self._insert_rule_row(rule)
+        self._fill_rules_table(self.controller.default_rules())
         self._populate_material_table()
         self._populate_pattern_table()
         self._populate_font_table()
 
-    def _insert_rule_row(self, rule: MappingRule) -> None:
-        row = self.rules_table.rowCount()
-        self.rules_table.insertRow(row)
-        for column, value in enumerate(rule.as_row()):
-            self._set_table_item(self.rules_table, row, column, value)
-
-    def _set_table_item(self, table: QTableWidget, row: int, column: int, value: Any) -> None:
-        text = "" if value is None else str(value)
-        table.setItem(row, column, QTableWidgetItem(text))
+    def _fill_rules_table(self, rules: Sequence[MappingRule]) -> None:
+        self.rules_model.set_rows(rule.as_row() for rule in rules)
 
     def _populate_material_table(self) -> None:
-        self.material_table.setRowCount(0)
-        materials = self.controller.get_material_map()
-        for material in sorted(materials.keys()):
-            entry = materials[material]
-            row = self.material_table.rowCount()
-            self.material_table.insertRow(row)
-            self._set_table_item(self.material_table, row, 0, material)
-            self._set_table_item(self.material_table, row, 1, entry.get("layer", ""))
-            self._set_table_item(self.material_table, row, 2, entry.get("color", ""))
-            self._set_table_item(self.material_table, row, 3, entry.get("linetype", ""))
-            self._set_table_item(self.material_table, row, 4, entry.get("lineweight", ""))
+        self.material_model.set_rows(self._material_rows())
 
     def _populate_pattern_table(self) -> None:
-        self.pattern_table.setRowCount(0)
+        self.pattern_model.set_rows(self._pattern_rows())
+
+    def _populate_font_table(self) -> None:
+        self.font_model.set_rows(self._font_rows())
+
+    # Table rows for the controller's current maps, as the populate helpers show them.
+
+    def _material_rows(self) -> List[Tuple[Any, ...]]:
+        materials = self.controller.get_material_map()
+        return [
+            (
+                material,
+                materials[material].get("layer", ""),
+                materials[material].get("color", ""),
+                materials[material].get("linetype", ""),
+                materials[material].get("lineweight", ""),
+            )
+            for material in sorted(materials.keys())
+        ]
+
+    def _pattern_rows(self) -> List[Tuple[Any, ...]]:
         patterns = self.controller.get_pattern_map()
+        rows = []
         for pattern_id in sorted(patterns.keys()):
             entry = patterns[pattern_id]
-            row = self.pattern_table.rowCount()
-            self.pattern_table.insertRow(row)
-            self._set_table_item(self.pattern_table, row, 0, pattern_id)
-            self._set_table_item(self.pattern_table, row, 1, entry.get("pattern", ""))
-            self._set_table_item(self.pattern_table, row, 2, entry.get("scale", ""))
-            self._set_table_item(self.pattern_table, row, 3, entry.get("angle", ""))
-            self._set_table_item(self.pattern_table, row, 4, entry.get("color", ""))
             solid_value = entry.get("solid", "")
             if isinstance(solid_value, bool):
                 solid_value = "Y" if solid_value else "N"
-            self._set_table_item(self.pattern_table, row, 5, solid_value)
-
-    def _populate_font_table(self) -> None:
-        self.font_table.setRowCount(0)
+            rows.append(
+                (
+                    pattern_id,
+                    entry.get("pattern", ""),
+                    entry.get("scale", ""),
+                    entry.get("angle", ""),
+                    entry.get("color", ""),
+                    solid_value,
+                )
+            )
+        return rows
+
+    def _font_rows(self) -> List[Tuple[Any, ...]]:
         fonts = self.controller.get_font_map()
-        for family in sorted(fonts.keys()):
-            entry = fonts[family]
-            row = self.font_table.rowCount()
-            self.font_table.insertRow(row)
-            self._set_table_item(self.font_table, row, 0, family)
-            self._set_table_item(self.font_table, row, 1, entry.get("style", ""))
-            self._set_table_item(self.font_table, row, 2, entry.get("font", ""))
+        return [
+            (family, fonts[family].get("style", ""), fonts[family].get("font", ""))
+            for family in sorted(fonts.keys())
+        ]
 
     # Slots / event handlers -------------------------------------------------
 
+    def _on_input_path_changed(self, text: str) -> None:
+        text = text.strip()
+        self._input_path = Path(text) if text else None
+
+    def _on_output_path_changed(self, text: str) -> None:
+        text = text.strip()
+        self._output_path = Path(text) if text else None
+
     def _browse_input(self) -> None:
-        file_path, _ = QFileDialog.getOpenFileName(self, "SVG 파일 선택", "", "SVG (*.svg)")
-        if file_path:
-            self.input_path_edit.setText(file_path)
+        if self._open_dialog is None:
+            self._open_dialog = QFileDialog(self, "SVG 파일 선택", "", "SVG (*.svg)")
+            self._open_dialog.setFileMode(QFileDialog.ExistingFile)
+        if self._open_dialog.exec_() and self._open_dialog.selectedFiles():
+            self.input_path_edit.setText(self._open_dialog.selectedFiles()[0])
 
     def _browse_output(self) -> None:
-        file_path, _ = QFileDialog.getSaveFileName(self, "DXF 파일 저장", "", "DXF (*.dxf)")
+        if self._save_dialog is None:
+            self._save_dialog = QFileDialog(self, "DXF 파일 저장", "", "DXF (*.dxf)")
+            self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        if not self._save_dialog.exec_():
+            return
+        selected = self._save_dialog.selectedFiles()
+        file_path = selected[0] if selected else ""
         if file_path:
             if not file_path.lower().endswith(".dxf"):
                 file_path += ".dxf"
             self.output_path_edit.setText(file_path)
 
     def _load_svg(self) -> None:
-        path_text = self.input_path_edit.text().strip()
-        if not path_text:
+        if self._active_task is not None:
+            return
+        path = self._input_path
+        if path is None:
             self._show_error("SVG 파일 경로를 입력해 주세요.")
             return
 
-        path = Path(path_text)
         if not path.exists():
             self._show_error("SVG 파일을 찾을 수 없습니다.")
             return
 
-        document, summary = self.controller.load_svg(path)
+        key = self._document_key(path)
+        if key is not None:
+            document = self._documents.get(key)
+            summary_text = self._summary_cache.get(key)
+            if document is not None and summary_text is not None:
+                self._summary_cache.move_to_end(key)
+                self._show_loaded_document(document, summary_text)
+                return
+
+        self._start_task(
+            partial(self.controller.load_svg, path),
+            partial(self._on_load_finished, key),
+            partial(self._on_task_failed, "SVG 로드 실패"),
+            "SVG 로드 중…",
+        )
+
+    @staticmethod
+    def _document_key(path: Path) -> DocumentKey | None:
+        try:
+            stat = path.stat()
+            return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _on_load_finished(self, key: DocumentKey | None, loaded: Tuple[SvgDocument, SvgDocumentSummary]) -> None:
+        self._finish_task()
+        document, summary = loaded
+        # The rendered summary is cached with the document; a reload only sets the label text.
+        summary_text = self._format_summary(summary)
+        if key is not None:
+            self._documents[key] = document
+            self._summary_cache[key] = summary_text
+            self._summary_cache.move_to_end(key)
+            if len(self._summary_cache) > DOCUMENT_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        self._show_loaded_document(document, summary_text)
+
+    def _show_loaded_document(self, document: SvgDocument, summary_text: str) -> None:
+        if document is not self.current_document:
+            self._convert_cache = None
+            self._previous_document = self.current_document
         self.current_document = document
+        self.summary_label.setText(summary_text)
+        self.statusBar().showMessage("SVG 로드 완료", 3000)
 
+    @staticmethod
+    def _format_summary(summary: SvgDocumentSummary) -> str:
         summary_text = [
             f"파일: {summary.path.name}",
             f"요소 수: {summary.total_entities}",
             f"종류별: {summary.format_counts()}",
         ]
-        if summary.warnings:
+        if summary.warning_count:
             summary_text.append("경고:")
-            summary_text.extend(f"  - {w}" for w in summary.warnings[:10])
-            if len(summary.warnings) > 10:
-                summary_text.append(f"  … 총 {len(summary.warnings)}건")
-
-        self.summary_label.setText("\n".join(summary_text))
-        self.statusBar().showMessage("SVG 로드 완료", 3000)
+            summary_text.extend(f"  - {w}" for w in islice(summary.warnings, 10))
+            if summary.warning_count > 10:
+                summary_text.append(f"  … 총 {summary.warning_count}건")
+        return "\n".join(summary_text)
 
     def _convert_to_dxf(self) -> None:
+        if self._active_task is not None:
+            return
         if self.current_document is None:
             self._show_error("먼저 SVG 파일을 로드해 주세요.")
             return
 
-        output_text = self.output_path_edit.text().strip()
-        if not output_text:
+        output_path = self._output_path
+        if output_path is None:
             self._show_error("DXF 출력 경로를 지정해 주세요.")
             return
 
-        output_path = Path(output_text)
         rules = self._apply_mapping_changes(save=False)
 
-        result = self.controller.convert(self.current_document, output_path, rules)
+        key: ConvertKey = (id(self.current_document), self._mapping_revision(), str(output_path))
+        if self._convert_cache is not None and self._convert_cache[0] == key:
+            # Same document, mappings and target: restore the written file only if it was changed since.
+            _, result, data, stat = self._convert_cache
+            if self._file_stat(output_path) != stat:
+                try:
+                    output_path.write_bytes(data)
+                except OSError as exc:
+                    self._show_error(f"DXF 변환 실패: {exc}")
+                    return
+                self._convert_cache = (key, result, data, self._file_stat(output_path))
+            self._show_conversion_result(output_path, result)
+            return
+
+        self._start_task(
+            partial(self._run_conversion, self.current_document, output_path, rules),
+            partial(self._on_convert_finished, key, output_path),
+            partial(self._on_task_failed, "DXF 변환 실패"),
+            "DXF 변환 중…",
+        )
+
+    def _run_conversion(
+        self, document: SvgDocument, output_path: Path, rules: List[MappingRule]
+    ) -> Tuple[ConversionResult, bytes]:
+        result = self.controller.convert(document, output_path, rules)
+        return result, output_path.read_bytes()
+
+    def _on_convert_finished(
+        self, key: ConvertKey, output_path: Path, converted: Tuple[ConversionResult, bytes]
+    ) -> None:
+        self._finish_task()
+        result, data = converted
+        self._convert_cache = (key, result, data, self._file_stat(output_path))
+        self._show_conversion_result(output_path, result)
+
+    def _mapping_revision(self) -> Tuple[int, ...] | None:
+        if not self._mapping_initialized:
+            return None
+        return (
+            self.rules_model.revision,
+            self.material_model.revision,
+            self.pattern_model.revision,
+            self.font_model.revision,
+        )
 
+    @staticmethod
+    def _file_stat(path: Path) -> Tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _show_conversion_result(self, output_path: Path, result: ConversionResult) -> None:
         self.log_output.clear()
-        if result.log_messages:
-            self.log_output.appendPlainText("\n".join(result.log_messages))
-        if result.warnings:
-            self.log_output.appendPlainText("\n경고:")
-            self.log_output.appendPlainText("\n".join(result.warnings))
+        self.log_output.setUpdatesEnabled(False)
+        try:
+            self._append_log_lines(result.log_messages)
+            if result.warnings:
+                self.log_output.appendPlainText("\n경고:")
+                self._append_log_lines(result.warnings)
+        finally:
+            self.log_output.setUpdatesEnabled(True)
 
         message = (
             f"DXF 변환 완료: {output_path}\n"
@@ -346,91 +539,131 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "완료", message)
         self.statusBar().showMessage("DXF 변환 완료", 3000)
 
+    def _append_log_lines(self, lines: Sequence[str]) -> None:
+        # Bounded chunks instead of one joined string for the whole log.
+        for start in range(0, len(lines), LOG_CHUNK_LINES):
+            self.log_output.appendPlainText("\n".join(lines[start : start + LOG_CHUNK_LINES]))
+
+    def _start_task(
+        self,
+        function: Callable[[], Any],
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None],
+        busy_message: str,
+    ) -> None:
+        # Loader and writer state is shared, so one task at a time: the buttons stay disabled until it reports back,
+        # and the load/convert handlers return early if they are reached some other way meanwhile.
+        task = _Task(function)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        self._active_task = task
+        self._set_busy(True)
+        self.statusBar().showMessage(busy_message)
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_task(self) -> None:
+        self._active_task = None
+        self._set_busy(False)
+        self.statusBar().clearMessage()
+
+    def _on_task_failed(self, title: str, message: str) -> None:
+        self._finish_task()
+        self._show_error(f"{title}: {message}")
+
+    def _set_busy(self, busy: bool) -> None:
+        buttons = [self.load_btn, self.convert_btn]
+        if self._mapping_initialized:
+            # Both write to the mapping manager, which a running conversion is reading.
+            buttons += [self.save_mapping_btn, self.reset_rules_btn]
+        for button in buttons:
+            button.setEnabled(not busy)
+
     def _collect_rules_from_table(self) -> List[MappingRule]:
+        revision = self.rules_model.revision
+        if self._rules_cache is not None and self._rules_cache[0] == revision:
+            return self._rules_cache[1]
+        rules = self._build_rules(self._model_rows(self.rules_model))
+        self._rules_cache = (revision, rules)
+        return rules
+
+    def _build_rules(self, rows: List[List[str]]) -> List[MappingRule]:
         rules: List[MappingRule] = []
-        for row in range(self.rules_table.rowCount()):
-            selector = self._item_text(row, 0)
+        invalid_weights: List[str] = []
+        for row, cells in enumerate(rows):
+            selector, layer, color, linetype, weight_text = cells
             if not selector:
                 continue
-            layer = self._item_text(row, 1) or "0"
-            color = self._item_text(row, 2) or "BYLAYER"
-            linetype = self._item_text(row, 3) or "Continuous"
-            weight_text = self._item_text(row, 4)
             lineweight = None
             if weight_text:
                 try:
                     lineweight = float(weight_text)
                 except ValueError:
-                    self.log_output.appendPlainText(f"경고: 행 {row + 1}의 선굵기 값이 잘못되었습니다. ({weight_text})")
-            rules.append(MappingRule(selector=selector, layer=layer, color=color, linetype=linetype, lineweight_mm=lineweight))
+                    invalid_weights.append(f"경고: 행 {row + 1}의 선굵기 값이 잘못되었습니다. ({weight_text})")
+            rules.append(
+                MappingRule(
+                    selector=selector,
+                    layer=layer or "0",
+                    color=color or "BYLAYER",
+                    linetype=linetype or "Continuous",
+                    lineweight_mm=lineweight,
+                )
+            )
+        if invalid_weights:
+            self.log_output.appendPlainText("\n".join(invalid_weights))
         return rules
 
-    def _collect_material_mapping(self) -> Dict[str, Dict[str, Any]]:
+    def _collect_material_mapping(self, rows: List[List[str]]) -> Dict[str, Dict[str, Any]]:
         mapping: Dict[str, Dict[str, Any]] = {}
-        for row in range(self.material_table.rowCount()):
-            material = self._item_text(row, 0, self.material_table)
+        for material, layer, color, linetype, weight_text in rows:
             if not material:
                 continue
             entry: Dict[str, Any] = {}
-            layer = self._item_text(row, 1, self.material_table)
             if layer:
                 entry["layer"] = layer
-            color = self._item_text(row, 2, self.material_table)
             if color:
                 entry["color"] = color
-            linetype = self._item_text(row, 3, self.material_table)
             if linetype:
                 entry["linetype"] = linetype
-            weight_text = self._item_text(row, 4, self.material_table)
             if weight_text:
                 entry["lineweight"] = weight_text
             if entry:
                 mapping[material] = entry
         return mapping
 
-    def _collect_pattern_mapping(self) -> Dict[str, Dict[str, Any]]:
+    def _collect_pattern_mapping(self, rows: List[List[str]]) -> Dict[str, Dict[str, Any]]:
         mapping: Dict[str, Dict[str, Any]] = {}
-        for row in range(self.pattern_table.rowCount()):
-            pattern_id = self._item_text(row, 0, self.pattern_table)
+        for pattern_id, pattern_name, scale_text, angle_text, color, solid_text in rows:
             if not pattern_id:
                 continue
             entry: Dict[str, Any] = {}
-            pattern_name = self._item_text(row, 1, self.pattern_table)
             if pattern_name:
                 entry["pattern"] = pattern_name
-            scale_text = self._item_text(row, 2, self.pattern_table)
             if scale_text:
                 try:
                     entry["scale"] = float(scale_text)
                 except ValueError:
                     self.log_output.appendPlainText(f"경고: 패턴 '{pattern_id}'의 Scale 값을 해석할 수 없습니다: {scale_text}")
-            angle_text = self._item_text(row, 3, self.pattern_table)
             if angle_text:
                 try:
                     entry["angle"] = float(angle_text)
                 except ValueError:
                     self.log_output.appendPlainText(f"경고: 패턴 '{pattern_id}'의 Angle 값을 해석할 수 없습니다: {angle_text}")
-            color = self._item_text(row, 4, self.pattern_table)
             if color:
                 entry["color"] = color
-            solid_text = self._item_text(row, 5, self.pattern_table)
             if solid_text:
                 entry["solid"] = solid_text
             if entry:
                 mapping[pattern_id] = entry
         return mapping
 
-    def _collect_font_mapping(self) -> Dict[str, Dict[str, Any]]:
+    def _collect_font_mapping(self, rows: List[List[str]]) -> Dict[str, Dict[str, Any]]:
         mapping: Dict[str, Dict[str, Any]] = {}
-        for row in range(self.font_table.rowCount()):
-            family = self._item_text(row, 0, self.font_table)
+        for family, style, font_file in rows:
             if not family:
                 continue
             entry: Dict[str, Any] = {}
-            style = self._item_text(row, 1, self.font_table)
             if style:
                 entry["style"] = style
-            font_file = self._item_text(row, 2, self.font_table)
             if font_file:
                 entry["font"] = font_file
             if "style" not in entry or not entry["style"]:
@@ -438,60 +671,62 @@ class MainWindow(QMainWindow):
             mapping[family] = entry
         return mapping
 
-    def _item_text(self, row: int, column: int, table: QTableWidget | None = None) -> str:
-        widget_table = table or self.rules_table
-        item = widget_table.item(row, column)
-        return item.text().strip() if item and item.text() else ""
+    @staticmethod
+    def _model_rows(model: MappingTableModel) -> List[List[str]]:
+        # Cell texts come straight from the model's backing list; no per-cell Qt lookups.
+        return [[cell.strip() for cell in row] for row in model.rows()]
+
+    @staticmethod
+    def _cell_rows(rows: Iterable[Sequence[Any]]) -> List[List[str]]:
+        # The texts _model_rows would return had these rows been put in a table.
+        return [["" if value is None else str(value).strip() for value in row] for row in rows]
 
     def _add_rule(self) -> None:
-        self._insert_rule_row(MappingRule(selector="class:", layer="0"))
+        self.rules_model.append_row(MappingRule(selector="class:", layer="0").as_row())
 
     def _remove_rule(self) -> None:
         self._remove_selected_rows(self.rules_table)
 
     def _add_material_entry(self) -> None:
-        row = self.material_table.rowCount()
-        self.material_table.insertRow(row)
-        for column in range(5):
-            self._set_table_item(self.material_table, row, column, "")
+        self.material_model.append_row([""] * 5)
 
     def _remove_material_entry(self) -> None:
         self._remove_selected_rows(self.material_table)
 
     def _add_pattern_entry(self) -> None:
-        row = self.pattern_table.rowCount()
-        self.pattern_table.insertRow(row)
-        for column in range(6):
-            default = "N" if column == 5 else ""
-            self._set_table_item(self.pattern_table, row, column, default)
+        self.pattern_model.append_row(["", "", "", "", "", "N"])
 
     def _remove_pattern_entry(self) -> None:
         self._remove_selected_rows(self.pattern_table)
 
     def _add_font_entry(self) -> None:
-        row = self.font_table.rowCount()
-        self.font_table.insertRow(row)
-        for column in range(3):
-            self._set_table_item(self.font_table, row, column, "")
+        self.font_model.append_row([""] * 3)
 
     def _remove_font_entry(self) -> None:
         self._remove_selected_rows(self.font_table)
 
-    def _remove_selected_rows(self, table: QTableWidget) -> None:
-        selected_rows = sorted({idx.row() for idx in table.selectedIndexes()}, reverse=True)
-        for row in selected_rows:
-            table.removeRow(row)
+    def _remove_selected_rows(self, table: QTableView) -> None:
+        table.model().remove_rows(idx.row() for idx in table.selectionModel().selectedIndexes())
 
     def _apply_mapping_changes(self, save: bool) -> List[MappingRule]:
-        rules = self._collect_rules_from_table()
-        materials = self._collect_material_mapping()
-        patterns = self._collect_pattern_mapping()
-        fonts = self._collect_font_mapping()
+        if self._mapping_initialized:
+            rules = self._collect_rules_from_table()
+            materials = self._collect_material_mapping(self._model_rows(self.material_model))
+            patterns = self._collect_pattern_mapping(self._model_rows(self.pattern_model))
+            fonts = self._collect_font_mapping(self._model_rows(self.font_model))
+        else:
+            # The tables were never built; run the manager's state through the same row round trip
+            # (formatted lineweights, default font styles, ...) so the result does not depend on it.
+            rules = self._build_rules(self._cell_rows(rule.as_row() for rule in self.controller.default_rules()))
+            materials = self._collect_material_mapping(self._cell_rows(self._material_rows()))
+            patterns = self._collect_pattern_mapping(self._cell_rows(self._pattern_rows()))
+            fonts = self._collect_font_mapping(self._cell_rows(self._font_rows()))
 
         if not rules:
             rules = MappingManager.default_rules()
 
-        self.controller.mapping_manager.rules = list(rules)
+        if self.controller.mapping_manager.rules != rules:
+            self.controller.mapping_manager.rules = list(rules)
         self.controller.update_mapping_config(materials, patterns, fonts)
 
         if save:
@@ -509,9 +744,7 @@ class MainWindow(QMainWindow):
     def _reset_rules(self) -> None:
         default_rules = MappingManager.default_rules()
         self.controller.mapping_manager.rules = list(default_rules)
-        self.rules_table.setRowCount(0)
-        for rule in default_rules:
-            self._insert_rule_row(rule)
+        self._fill_rules_table(default_rules)
         self._populate_material_table()
         self._populate_pattern_table()
         self._populate_font_table()
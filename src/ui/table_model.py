@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Sequence
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class MappingTableModel(QAbstractTableModel):
+    """Editable string grid backing the mapping tables; cells live in a plain Python list."""
+
+    def __init__(self, headers: Sequence[str], parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows: List[List[str]] = []
+        # Bumped on every change so callers can memoize whatever they derive from the rows.
+        self.revision = 0
+
+    # Python-side access ------------------------------------------------------
+
+    def rows(self) -> List[List[str]]:
+        """Current cell texts, one list per row; read it without going through Qt."""
+        return self._rows
+
+    def set_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        self.beginResetModel()
+        self._rows = [self._normalize_row(values) for values in rows]
+        self.revision += 1
+        self.endResetModel()
+
+    def append_row(self, values: Sequence[Any]) -> None:
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(self._normalize_row(values))
+        self.revision += 1
+        self.endInsertRows()
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        # Selected rows are removed as contiguous runs, bottom-up so earlier indices stay valid.
+        pending = sorted({row for row in rows if 0 <= row < len(self._rows)}, reverse=True)
+        while pending:
+            last = first = pending.pop(0)
+            while pending and pending[0] == first - 1:
+                first = pending.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first : last + 1]
+            self.revision += 1
+            self.endRemoveRows()
+
+    def _normalize_row(self, values: Sequence[Any]) -> List[str]:
+        cells = ["" if value is None else str(value) for value in values]
+        cells.extend([""] * (len(self._headers) - len(cells)))
+        return cells[: len(self._headers)]
+
+    # QAbstractTableModel interface -------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = "" if value is None else str(value)
+        self.revision += 1
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return section + 1